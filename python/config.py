@@ -8,13 +8,16 @@ piano generator. It includes:
 - Configuration file handling
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import os
+import re
+import sys
 import enum
-import configparser
-from jproperties import Properties
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Callable, Optional, Dict, Any, List, Tuple, Union
 
 class BoardType(enum.Enum):
     """Type of board initialization to use"""
@@ -30,13 +33,18 @@ class BoardType(enum.Enum):
         # Normalize input: lowercase and replace hyphens/spaces with underscores
         normalized = value.lower().replace('-', '_').replace(' ', '_')
         
-        for member in cls:
-            if member.value == normalized:
-                return member
-        raise ValueError(f"Invalid board type: {value}")
+        member = _BOARD_TYPE_LOOKUP.get(normalized)
+        if member is None:
+            raise ValueError(f"Invalid board type: {value}")
+        return member
+
+# Board type value -> member, built once for BoardType.from_string
+_BOARD_TYPE_LOOKUP: Dict[str, BoardType] = {member.value: member for member in BoardType}
 
 class GenerationLimit:
     """Configuration for generation limit"""
+    __slots__ = ('is_limited', 'limit')
+    
     UNLIMITED = "unlimited"
     
     def __init__(self, value: Union[str, int, Dict[str, int]] = UNLIMITED):
@@ -58,8 +66,200 @@ class GenerationLimit:
             return self.UNLIMITED
         return f"Limited({self.limit})"
 
+# One 'key = value', 'key: value' or 'key value' line of a properties file; comment lines
+# (starting with '#' or '!') never match, a bare key yields an empty value and a trailing
+# '\r' from Windows line endings is dropped
+_PROPERTY_RE = re.compile(r'^[ \t\f]*([^#!\s=:][^\s=:]*)[ \t\f]*[=:]?[ \t\f]*(.*?)[ \t\f\r]*$', re.M)
+
+def _parse_bool(value: str) -> bool:
+    """Interpret a flag value from the environment or a config file"""
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+_ENV_PREFIX = 'CONWAYS_STEINWAY_'
+
+# Environment variable -> (Config attribute, converter)
+_ENV_SPEC: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ('CONWAYS_STEINWAY_BOARD_TYPE', 'board_type', BoardType.from_string),
+    ('CONWAYS_STEINWAY_SILENT', 'silent', _parse_bool),
+    ('CONWAYS_STEINWAY_GENERATIONS', 'generations', GenerationLimit),
+    ('CONWAYS_STEINWAY_STEP_DELAY', 'step_delay_ms', int),
+    ('CONWAYS_STEINWAY_TEMPO', 'tempo_bpm', float),
+    # Audio settings
+    ('CONWAYS_STEINWAY_NOTE_DURATION', 'note_duration_ms', int),
+    ('CONWAYS_STEINWAY_GAP', 'gap_ms', int),
+    ('CONWAYS_STEINWAY_CHORD_DURATION', 'chord_duration_ms', int),
+    ('CONWAYS_STEINWAY_INITIAL_DELAY', 'initial_delay_ms', int),
+    ('CONWAYS_STEINWAY_DETECT_CHORDS', 'detect_chords', _parse_bool),
+    ('CONWAYS_STEINWAY_VOLUME', 'volume', float),
+    ('CONWAYS_STEINWAY_PITCH_SHIFT', 'pitch_shift', _parse_bool),
+    # Random board settings
+    ('CONWAYS_STEINWAY_ALIVE_PROBABILITY', 'alive_probability', float),
+    # Board dimensions
+    ('CONWAYS_STEINWAY_BOARD_HEIGHT', 'board_height', int),
+)
+
+# Properties file key -> (Config attribute, converter). Later entries win, so the
+# legacy 'volume' and 'pitch.shift' aliases come before their 'audio.' forms.
+_FILE_SPEC: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ('board.type', 'board_type', BoardType.from_string),
+    ('generations', 'generations', GenerationLimit),
+    ('step.delay.ms', 'step_delay_ms', int),
+    ('tempo.bpm', 'tempo_bpm', float),
+    # Audio configuration
+    ('audio.note.duration.ms', 'note_duration_ms', int),
+    ('audio.gap.ms', 'gap_ms', int),
+    ('audio.chord.duration.ms', 'chord_duration_ms', int),
+    ('audio.initial.delay.ms', 'initial_delay_ms', int),
+    ('audio.detect.chords', 'detect_chords', _parse_bool),
+    ('volume', 'volume', float),
+    ('audio.volume', 'volume', float),
+    ('pitch.shift', 'pitch_shift', _parse_bool),
+    ('audio.pitch.shift', 'pitch_shift', _parse_bool),
+    # Random board configuration
+    ('random.alive.probability', 'alive_probability', float),
+    # Board dimensions
+    ('board.height', 'board_height', int),
+)
+
+# Parsed properties files, keyed by path and validated against (mtime, size)
+_FILE_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+def _read_properties(file_path: Path) -> Dict[str, str]:
+    """Parse a properties file, reusing the previous parse if the file is unchanged"""
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {file_path}") from None
+    
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(file_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    # Read through one handle and stamp the cache entry from that same handle, so the
+    # stamp always describes the bytes that were parsed
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    
+    # Parse all 'key = value' lines in a single pass over the file
+    properties = dict(_PROPERTY_RE.findall(data.decode('utf-8')))
+    _FILE_CACHE[file_path] = ((st.st_mtime_ns, st.st_size), properties)
+    return properties
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(items: tuple) -> tuple:
+    """Match the given environment items to (attribute, converter, raw value) triples"""
+    env = dict(items)
+    matches = []
+    for key, attr, convert in _ENV_SPEC:
+        value = env.get(key)
+        if value is not None:
+            matches.append((attr, convert, value))
+    return tuple(matches)
+
+def _env_overrides() -> tuple:
+    """Get the configuration overrides from the current environment"""
+    items = tuple(sorted(item for item in os.environ.items() if item[0].startswith(_ENV_PREFIX)))
+    # Convert on every call so no Config shares a mutable value such as a GenerationLimit
+    return tuple((attr, convert(value)) for attr, convert, value in _parse_env(items))
+
+# Option strings of the optional argument groups, used to sniff argv before building the parser
+_AUDIO_OPTIONS = ('--note-duration', '--gap', '--chord-duration', '--initial-delay',
+                  '--no-detect-chords', '--volume', '--no-pitch-shift')
+_RANDOM_OPTIONS = ('--alive-probability',)
+_DIMENSION_OPTIONS = ('--height',)
+
+# Parsed value of each argument when it is absent from the command line
+_CORE_ARG_DEFAULTS = {'config': None, 'board_type': None, 'silent': False,
+                      'generations': None, 'step_delay': None, 'tempo': None}
+_AUDIO_ARG_DEFAULTS = {'note_duration_ms': None, 'gap_ms': None, 'chord_duration_ms': None,
+                       'initial_delay_ms': None, 'detect_chords': True, 'volume': None,
+                       'pitch_shift': True}
+_RANDOM_ARG_DEFAULTS = {'alive_probability': None}
+_DIMENSION_ARG_DEFAULTS = {'board_height': None}
+_ARG_DEFAULTS = {**_CORE_ARG_DEFAULTS, **_AUDIO_ARG_DEFAULTS,
+                 **_RANDOM_ARG_DEFAULTS, **_DIMENSION_ARG_DEFAULTS}
+
+def _wants_options(argv: List[str], options: tuple) -> bool:
+    """Check whether any command-line token may select one of the given options"""
+    for token in argv:
+        if token in ('-h', '--help'):
+            # Help output must list every option
+            return True
+        if token.startswith('--'):
+            # argparse accepts unambiguous prefixes, so match on prefix rather than equality
+            name = token.split('=', 1)[0]
+            if any(option.startswith(name) for option in options):
+                return True
+    return False
+
+class _TrimmedArgumentParser(argparse.ArgumentParser):
+    """Parser missing some option groups; it raises on errors so the full parser can report them"""
+    def error(self, message):
+        raise argparse.ArgumentError(None, message)
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(audio: bool = True, random_board: bool = True,
+                  dimensions: bool = True) -> argparse.ArgumentParser:
+    """Build the command-line parser, skipping option groups that argv doesn't use"""
+    parser_class = argparse.ArgumentParser if audio and random_board and dimensions else _TrimmedArgumentParser
+    parser = parser_class(description="Conway's Steinway - Game of Life Piano Generator")
+    parser.add_argument('--config', type=str, help='Path to configuration file')
+    parser.add_argument('--board-type', type=str, choices=['random', 'static', 'fur_elise', 'complex', 'showcase'], 
+                       help='Board initialization type')
+    parser.add_argument('--silent', action='store_true', help='Disable audio output')
+    # Remove --audio flag since audio is now the default and we only check for --silent
+    parser.add_argument('--generations', type=str, 
+                       help='Generation limit (number or "Unlimited")')
+    parser.add_argument('--step-delay', type=int, 
+                       help='Delay between steps in milliseconds')
+    parser.add_argument('--tempo', type=float, 
+                       help='Musical tempo in beats per minute')
+    
+    # Audio settings
+    if audio:
+        parser.add_argument('--note-duration', type=int, dest='note_duration_ms',
+                           help='Duration of individual notes in milliseconds')
+        parser.add_argument('--gap', type=int, dest='gap_ms',
+                           help='Gap between notes in milliseconds')
+        parser.add_argument('--chord-duration', type=int, dest='chord_duration_ms',
+                           help='Duration of chords in milliseconds')
+        parser.add_argument('--initial-delay', type=int, dest='initial_delay_ms',
+                           help='Initial delay between notes in milliseconds')
+        # Remove --detect-chords flag since it's now the default and we only check for --no-detect-chords
+        parser.add_argument('--no-detect-chords', action='store_false', dest='detect_chords',
+                           help='Disable automatic chord detection')
+        parser.add_argument('--volume', type=float,
+                           help='Audio volume (0.0-1.0)')
+        # Remove --pitch-shift flag since it's now the default and we only check for --no-pitch-shift
+        parser.add_argument('--no-pitch-shift', action='store_false', dest='pitch_shift',
+                           help='Disable pitch shifting')
+    else:
+        parser.set_defaults(**_AUDIO_ARG_DEFAULTS)
+    
+    # Random board settings
+    if random_board:
+        parser.add_argument('--alive-probability', type=float,
+                           help='Probability of cells being alive in random boards (0.0-1.0)')
+    else:
+        parser.set_defaults(**_RANDOM_ARG_DEFAULTS)
+    
+    # Board dimensions
+    if dimensions:
+        parser.add_argument('--height', type=int, dest='board_height',
+                           help='Board height in cells')
+    else:
+        parser.set_defaults(**_DIMENSION_ARG_DEFAULTS)
+    
+    return parser
+
 class Config:
     """Configuration for Conway's Steinway"""
+    __slots__ = ('board_type', 'silent', 'generations', '_step_delay_ms', '_tempo_bpm',
+                 '_effective_delay', 'config_file', 'note_duration_ms', 'gap_ms', 'chord_duration_ms',
+                 'initial_delay_ms', 'detect_chords', 'volume', 'pitch_shift',
+                 'alive_probability', 'board_width', 'board_height')
     
     def __init__(self):
         """Initialize with default values"""
@@ -72,6 +272,9 @@ class Config:
         # Generation limit
         self.generations: GenerationLimit = GenerationLimit()  # Unlimited by default
         
+        # Delay derived from step_delay_ms / tempo_bpm, computed on first use
+        self._effective_delay: Optional[int] = None
+        
         # Delay between steps in milliseconds
         self.step_delay_ms: int = 200
         
@@ -97,52 +300,47 @@ class Config:
         self.board_width = 88  # Fixed at 88 cells to match piano keys
         self.board_height = 40
     
+    @property
+    def step_delay_ms(self) -> int:
+        """Delay between steps in milliseconds"""
+        return self._step_delay_ms
+    
+    @step_delay_ms.setter
+    def step_delay_ms(self, value: int) -> None:
+        self._step_delay_ms = value
+        self._effective_delay = None
+    
+    @property
+    def tempo_bpm(self) -> Optional[float]:
+        """Musical tempo in beats per minute (overrides step_delay_ms when set)"""
+        return self._tempo_bpm
+    
+    @tempo_bpm.setter
+    def tempo_bpm(self, value: Optional[float]) -> None:
+        self._tempo_bpm = value
+        self._effective_delay = None
+    
     @classmethod
     def from_args_and_env(cls) -> 'Config':
         """Create a configuration from command-line args and environment variables"""
         config = cls()
         
-        # Parse command-line arguments
-        parser = argparse.ArgumentParser(description="Conway's Steinway - Game of Life Piano Generator")
-        parser.add_argument('--config', type=str, help='Path to configuration file')
-        parser.add_argument('--board-type', type=str, choices=['random', 'static', 'fur_elise', 'complex', 'showcase'], 
-                           help='Board initialization type')
-        parser.add_argument('--silent', action='store_true', help='Disable audio output')
-        # Remove --audio flag since audio is now the default and we only check for --silent
-        parser.add_argument('--generations', type=str, 
-                           help='Generation limit (number or "Unlimited")')
-        parser.add_argument('--step-delay', type=int, 
-                           help='Delay between steps in milliseconds')
-        parser.add_argument('--tempo', type=float, 
-                           help='Musical tempo in beats per minute')
-        
-        # Audio settings
-        parser.add_argument('--note-duration', type=int, dest='note_duration_ms',
-                           help='Duration of individual notes in milliseconds')
-        parser.add_argument('--gap', type=int, dest='gap_ms',
-                           help='Gap between notes in milliseconds')
-        parser.add_argument('--chord-duration', type=int, dest='chord_duration_ms',
-                           help='Duration of chords in milliseconds')
-        parser.add_argument('--initial-delay', type=int, dest='initial_delay_ms',
-                           help='Initial delay between notes in milliseconds')
-        # Remove --detect-chords flag since it's now the default and we only check for --no-detect-chords
-        parser.add_argument('--no-detect-chords', action='store_false', dest='detect_chords',
-                           help='Disable automatic chord detection')
-        parser.add_argument('--volume', type=float,
-                           help='Audio volume (0.0-1.0)')
-        # Remove --pitch-shift flag since it's now the default and we only check for --no-pitch-shift
-        parser.add_argument('--no-pitch-shift', action='store_false', dest='pitch_shift',
-                           help='Disable pitch shifting')
-        
-        # Random board settings
-        parser.add_argument('--alive-probability', type=float,
-                           help='Probability of cells being alive in random boards (0.0-1.0)')
-        
-        # Board dimensions
-        parser.add_argument('--height', type=int, dest='board_height',
-                           help='Board height in cells')
-        
-        args = parser.parse_args()
+        # Parse command-line arguments, only building the option groups that argv can select
+        argv = sys.argv[1:]
+        if not argv:
+            # Nothing to parse (embedded use, tests): skip building the parser entirely
+            args = argparse.Namespace(**_ARG_DEFAULTS)
+        else:
+            parser = _build_parser(
+                audio=_wants_options(argv, _AUDIO_OPTIONS),
+                random_board=_wants_options(argv, _RANDOM_OPTIONS),
+                dimensions=_wants_options(argv, _DIMENSION_OPTIONS),
+            )
+            try:
+                args = parser.parse_args(argv)
+            except argparse.ArgumentError:
+                # Report errors with the full parser so the message and usage line list every option
+                args = _build_parser().parse_args(argv)
         
         # Apply command-line arguments if provided
         if args.config:
@@ -198,157 +396,55 @@ class Config:
             config.board_height = args.board_height
         
         # Apply environment variables if present (standardized format)
-        if 'CONWAYS_STEINWAY_BOARD_TYPE' in os.environ:
-            config.board_type = BoardType.from_string(os.environ['CONWAYS_STEINWAY_BOARD_TYPE'])
-        
-        if 'CONWAYS_STEINWAY_SILENT' in os.environ:
-            value = os.environ['CONWAYS_STEINWAY_SILENT'].lower()
-            config.silent = value in ('1', 'true', 'yes', 'on')
-        
-        if 'CONWAYS_STEINWAY_GENERATIONS' in os.environ:
-            config.generations = GenerationLimit(os.environ['CONWAYS_STEINWAY_GENERATIONS'])
-        
-        if 'CONWAYS_STEINWAY_STEP_DELAY' in os.environ:
-            config.step_delay_ms = int(os.environ['CONWAYS_STEINWAY_STEP_DELAY'])
-        
-        if 'CONWAYS_STEINWAY_TEMPO' in os.environ:
-            config.tempo_bpm = float(os.environ['CONWAYS_STEINWAY_TEMPO'])
-            
-        # Audio settings from environment variables
-        if 'CONWAYS_STEINWAY_NOTE_DURATION' in os.environ:
-            config.note_duration_ms = int(os.environ['CONWAYS_STEINWAY_NOTE_DURATION'])
-            
-        if 'CONWAYS_STEINWAY_GAP' in os.environ:
-            config.gap_ms = int(os.environ['CONWAYS_STEINWAY_GAP'])
-            
-        if 'CONWAYS_STEINWAY_CHORD_DURATION' in os.environ:
-            config.chord_duration_ms = int(os.environ['CONWAYS_STEINWAY_CHORD_DURATION'])
-            
-        if 'CONWAYS_STEINWAY_INITIAL_DELAY' in os.environ:
-            config.initial_delay_ms = int(os.environ['CONWAYS_STEINWAY_INITIAL_DELAY'])
-            
-        if 'CONWAYS_STEINWAY_DETECT_CHORDS' in os.environ:
-            value = os.environ['CONWAYS_STEINWAY_DETECT_CHORDS'].lower()
-            config.detect_chords = value in ('1', 'true', 'yes', 'on')
-            
-        if 'CONWAYS_STEINWAY_VOLUME' in os.environ:
-            config.volume = float(os.environ['CONWAYS_STEINWAY_VOLUME'])
-            
-        if 'CONWAYS_STEINWAY_PITCH_SHIFT' in os.environ:
-            value = os.environ['CONWAYS_STEINWAY_PITCH_SHIFT'].lower()
-            config.pitch_shift = value in ('1', 'true', 'yes', 'on')
-            
-        # Random board settings from environment variables
-        if 'CONWAYS_STEINWAY_ALIVE_PROBABILITY' in os.environ:
-            config.alive_probability = float(os.environ['CONWAYS_STEINWAY_ALIVE_PROBABILITY'])
-            
-        # Board dimensions from environment variables
-        if 'CONWAYS_STEINWAY_BOARD_HEIGHT' in os.environ:
-            config.board_height = int(os.environ['CONWAYS_STEINWAY_BOARD_HEIGHT'])
+        for attr, value in _env_overrides():
+            setattr(config, attr, value)
         
         return config
     
     def load_from_file(self, file_path: Path) -> None:
-        """Load configuration from a properties file using the jproperties library"""
+        """Load configuration from a properties file"""
         try:
-            if not file_path.exists():
-                raise FileNotFoundError(f"Config file not found: {file_path}")
-            
-            # Use jproperties to parse the file
-            properties = Properties()
-            with open(file_path, 'rb') as f:
-                properties.load(f)
-            
-            # Get raw file contents to check for presence of 'silent' key
-            with open(file_path, 'r') as f:
-                raw_content = f.read()
-                self.silent = 'silent' in raw_content
+            properties = _read_properties(file_path)
             
-            # Apply core configuration values from file
-            if 'board.type' in properties:
-                board_type_val = properties.get('board.type').data
-                self.board_type = BoardType.from_string(board_type_val)
+            # A bare 'silent' key enables silent mode
+            self.silent = 'silent' in properties
             
-            if 'generations' in properties:
-                generations_val = properties.get('generations').data
-                self.generations = GenerationLimit(generations_val)
-            
-            if 'step.delay.ms' in properties:
-                delay_val = properties.get('step.delay.ms').data
-                self.step_delay_ms = int(delay_val)
-            
-            if 'tempo.bpm' in properties:
-                tempo_val = properties.get('tempo.bpm').data
-                self.tempo_bpm = float(tempo_val)
-                
-            # Load audio configuration
-            if 'audio.note.duration.ms' in properties:
-                self.note_duration_ms = int(properties.get('audio.note.duration.ms').data)
-                
-            if 'audio.gap.ms' in properties:
-                self.gap_ms = int(properties.get('audio.gap.ms').data)
-                
-            if 'audio.chord.duration.ms' in properties:
-                self.chord_duration_ms = int(properties.get('audio.chord.duration.ms').data)
-                
-            if 'audio.initial.delay.ms' in properties:
-                self.initial_delay_ms = int(properties.get('audio.initial.delay.ms').data)
-                
-            if 'audio.detect.chords' in properties:
-                value = properties.get('audio.detect.chords').data.lower()
-                self.detect_chords = value in ('true', 'yes', 'on', '1')
-                    
-            # Load random board configuration
-            if 'random.alive.probability' in properties:
-                prob_val = properties.get('random.alive.probability').data
-                self.alive_probability = float(prob_val)
-            
-            # Additional audio settings
-            if 'audio.volume' in properties:
-                self.volume = float(properties.get('audio.volume').data)
-            elif 'volume' in properties:
-                self.volume = float(properties.get('volume').data)
-                
-            if 'audio.pitch.shift' in properties:
-                value = properties.get('audio.pitch.shift').data.lower()
-                self.pitch_shift = value in ('true', 'yes', 'on', '1')
-            elif 'pitch.shift' in properties:
-                value = properties.get('pitch.shift').data.lower()
-                self.pitch_shift = value in ('true', 'yes', 'on', '1')
-            
-            # Apply board height if present
-            if 'board.height' in properties:
-                self.board_height = int(properties.get('board.height').data)
+            # Apply configuration values from file
+            for key, attr, convert in _FILE_SPEC:
+                value = properties.get(key)
+                if value is not None:
+                    setattr(self, attr, convert(value))
                 
         except Exception as e:
             print(f"Error loading config file: {e}")
             
     def __str__(self) -> str:
         """String representation of the configuration"""
-        result = (
-            f"Config:\n"
-            f"  Board Type: {self.board_type.value}\n"
-            f"  Silent Mode: {self.silent}\n"
-            f"  Generations: {self.generations}\n"
-            f"  Step Delay: {self.step_delay_ms}ms\n"
-            f"  Tempo: {self.tempo_bpm if self.tempo_bpm else 'Not set'}\n"
-            f"  Board: {self.board_width}×{self.board_height}\n"
-        )
-        
-        # Audio settings
-        result += (f"  Audio Settings:\n"
-                  f"    Note Duration: {self.note_duration_ms}ms\n"
-                  f"    Chord Duration: {self.chord_duration_ms}ms\n"
-                  f"    Gap Between Notes: {self.gap_ms}ms\n"
-                  f"    Volume: {self.volume}\n"
-                  f"    Detect Chords: {self.detect_chords}\n"
-                  f"    Pitch Shift: {self.pitch_shift}\n")
+        parts = [
+            "Config:",
+            f"  Board Type: {self.board_type.value}",
+            f"  Silent Mode: {self.silent}",
+            f"  Generations: {self.generations}",
+            f"  Step Delay: {self.step_delay_ms}ms",
+            f"  Tempo: {self.tempo_bpm if self.tempo_bpm else 'Not set'}",
+            f"  Board: {self.board_width}×{self.board_height}",
+            # Audio settings
+            "  Audio Settings:",
+            f"    Note Duration: {self.note_duration_ms}ms",
+            f"    Chord Duration: {self.chord_duration_ms}ms",
+            f"    Gap Between Notes: {self.gap_ms}ms",
+            f"    Volume: {self.volume}",
+            f"    Detect Chords: {self.detect_chords}",
+            f"    Pitch Shift: {self.pitch_shift}",
+        ]
         
         # Random board settings
-        if self.board_type == BoardType.RANDOM:
-            result += f"  Random Board: {self.alive_probability*100:.1f}% alive cells\n"
-            
-        return result
+        if self.board_type is BoardType.RANDOM:
+            parts.append(f"  Random Board: {self.alive_probability*100:.1f}% alive cells")
+        
+        # Keep the trailing newline of the previous multi-line format
+        parts.append("")
+        return "\n".join(parts)
         
     def print_config(self) -> None:
         """Print the configuration to the console"""
@@ -356,12 +452,18 @@ class Config:
         
     def get_effective_delay(self) -> int:
         """Get the effective delay in milliseconds based on configuration"""
-        if self.tempo_bpm is not None:
-            # Convert tempo in BPM to delay in ms
-            # 60000 ms in a minute / BPM = ms per beat
-            return int(60000 / self.tempo_bpm)
-        return self.step_delay_ms
+        delay = self._effective_delay
+        if delay is None:
+            if self._tempo_bpm is not None:
+                # Convert tempo in BPM to delay in ms
+                # 60000 ms in a minute / BPM = ms per beat
+                delay = int(60000 / self._tempo_bpm)
+            else:
+                delay = self._step_delay_ms
+            self._effective_delay = delay
+        return delay
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the config directory"""
     # Find config relative to project root
@@ -374,6 +476,7 @@ def get_config_path() -> Path:
     
     return config_path
 
+@functools.lru_cache(maxsize=1)
 def get_default_config_file() -> Path:
     """Get the default config file path"""
     return get_config_path() / 'conways_steinway.properties'
@@ -5,7 +5,7 @@ This module contains functions to create and manipulate Game of Life boards
 with various patterns and configurations.
 """
 
-from life import Life, Cell, BOARD_WIDTH, BOARD_HEIGHT
+from life import Life, BOARD_WIDTH, BOARD_HEIGHT
 
 
 class GameBoard:
@@ -94,244 +94,91 @@ class GameBoard:
     @staticmethod
     def create_block(game, row, col):
         """Create a 2x2 block still life pattern."""
-        game.set_cell(row, col, Cell.ALIVE)
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 1, Cell.ALIVE)
+        game.stamp('block', row, col)
     
     @staticmethod
     def create_beehive(game, row, col):
         """Create a beehive still life pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 3, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 2, Cell.ALIVE)
+        game.stamp('beehive', row, col)
     
     @staticmethod
     def create_loaf(game, row, col):
         """Create a loaf still life pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 3, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 3, Cell.ALIVE)
-        game.set_cell(row + 3, col + 2, Cell.ALIVE)
+        game.stamp('loaf', row, col)
     
     @staticmethod
     def create_boat(game, row, col):
         """Create a boat still life pattern."""
-        game.set_cell(row, col, Cell.ALIVE)
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 2, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
+        game.stamp('boat', row, col)
     
     # Oscillator patterns
     @staticmethod
     def create_blinker(game, row, col):
         """Create a blinker oscillator pattern."""
-        game.set_cell(row, col, Cell.ALIVE)
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 2, Cell.ALIVE)
+        game.stamp('blinker', row, col)
     
     @staticmethod
     def create_toad(game, row, col):
         """Create a toad oscillator pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row, col + 3, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 1, Cell.ALIVE)
-        game.set_cell(row + 1, col + 2, Cell.ALIVE)
+        game.stamp('toad', row, col)
     
     @staticmethod
     def create_beacon(game, row, col):
         """Create a beacon oscillator pattern."""
-        game.set_cell(row, col, Cell.ALIVE)
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 2, Cell.ALIVE)
-        game.set_cell(row + 2, col + 3, Cell.ALIVE)
-        game.set_cell(row + 3, col + 2, Cell.ALIVE)
-        game.set_cell(row + 3, col + 3, Cell.ALIVE)
+        game.stamp('beacon', row, col)
     
     @staticmethod
     def create_pulsar(game, row, col):
         """Create a pulsar oscillator pattern."""
-        # Top cross
-        for i in range(3):
-            game.set_cell(row + 2, col + 4 + i, Cell.ALIVE)
-            game.set_cell(row + 2, col + 10 + i, Cell.ALIVE)
-        
-        # Vertical lines
-        for i in range(3):
-            game.set_cell(row + 4 + i, col + 2, Cell.ALIVE)
-            game.set_cell(row + 4 + i, col + 7, Cell.ALIVE)
-            game.set_cell(row + 4 + i, col + 9, Cell.ALIVE)
-            game.set_cell(row + 4 + i, col + 14, Cell.ALIVE)
-            
-            game.set_cell(row + 10 + i, col + 2, Cell.ALIVE)
-            game.set_cell(row + 10 + i, col + 7, Cell.ALIVE)
-            game.set_cell(row + 10 + i, col + 9, Cell.ALIVE)
-            game.set_cell(row + 10 + i, col + 14, Cell.ALIVE)
-        
-        # Horizontal lines
-        for i in range(3):
-            game.set_cell(row + 7, col + 4 + i, Cell.ALIVE)
-            game.set_cell(row + 7, col + 10 + i, Cell.ALIVE)
-            game.set_cell(row + 9, col + 4 + i, Cell.ALIVE)
-            game.set_cell(row + 9, col + 10 + i, Cell.ALIVE)
-        
-        # Bottom cross
-        for i in range(3):
-            game.set_cell(row + 14, col + 4 + i, Cell.ALIVE)
-            game.set_cell(row + 14, col + 10 + i, Cell.ALIVE)
+        game.stamp('pulsar', row, col)
     
     @staticmethod
     def create_pentadecathlon(game, row, col):
         """Create a pentadecathlon oscillator pattern."""
-        # Central line
-        for i in range(8):
-            game.set_cell(row + i, col + 1, Cell.ALIVE)
-        
-        # End pieces
-        game.set_cell(row + 3, col, Cell.ALIVE)
-        game.set_cell(row + 3, col + 2, Cell.ALIVE)
-        game.set_cell(row + 4, col, Cell.ALIVE)
-        game.set_cell(row + 4, col + 2, Cell.ALIVE)
+        game.stamp('pentadecathlon', row, col)
     
     # Spaceship patterns
     @staticmethod
     def create_glider(game, row, col):
         """Create a glider spaceship pattern."""
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 2, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 2, Cell.ALIVE)
+        game.stamp('glider', row, col)
     
     @staticmethod
     def create_lwss(game, row, col):
         """Create a lightweight spaceship pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 4, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 2, col, Cell.ALIVE)
-        game.set_cell(row + 2, col + 4, Cell.ALIVE)
-        game.set_cell(row + 3, col, Cell.ALIVE)
-        game.set_cell(row + 3, col + 1, Cell.ALIVE)
-        game.set_cell(row + 3, col + 2, Cell.ALIVE)
-        game.set_cell(row + 3, col + 3, Cell.ALIVE)
+        game.stamp('lwss', row, col)
     
     @staticmethod
     def create_mwss(game, row, col):
         """Create a middleweight spaceship pattern."""
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 4, Cell.ALIVE)
-        game.set_cell(row + 2, col + 5, Cell.ALIVE)
-        game.set_cell(row + 3, col, Cell.ALIVE)
-        game.set_cell(row + 3, col + 5, Cell.ALIVE)
-        game.set_cell(row + 4, col + 1, Cell.ALIVE)
-        game.set_cell(row + 4, col + 2, Cell.ALIVE)
-        game.set_cell(row + 4, col + 3, Cell.ALIVE)
-        game.set_cell(row + 4, col + 4, Cell.ALIVE)
-        game.set_cell(row + 4, col + 5, Cell.ALIVE)
+        game.stamp('mwss', row, col)
     
     @staticmethod
     def create_hwss(game, row, col):
         """Create a heavyweight spaceship pattern."""
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row, col + 3, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 5, Cell.ALIVE)
-        game.set_cell(row + 2, col + 6, Cell.ALIVE)
-        game.set_cell(row + 3, col, Cell.ALIVE)
-        game.set_cell(row + 3, col + 6, Cell.ALIVE)
-        game.set_cell(row + 4, col + 1, Cell.ALIVE)
-        game.set_cell(row + 4, col + 2, Cell.ALIVE)
-        game.set_cell(row + 4, col + 3, Cell.ALIVE)
-        game.set_cell(row + 4, col + 4, Cell.ALIVE)
-        game.set_cell(row + 4, col + 5, Cell.ALIVE)
-        game.set_cell(row + 4, col + 6, Cell.ALIVE)
+        game.stamp('hwss', row, col)
     
     # Methuselah patterns
     @staticmethod
     def create_r_pentomino(game, row, col):
         """Create an R-pentomino methuselah pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row, col + 2, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
+        game.stamp('r_pentomino', row, col)
     
     @staticmethod
     def create_diehard(game, row, col):
         """Create a diehard methuselah pattern."""
-        game.set_cell(row, col + 6, Cell.ALIVE)
-        game.set_cell(row + 1, col, Cell.ALIVE)
-        game.set_cell(row + 1, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 5, Cell.ALIVE)
-        game.set_cell(row + 2, col + 6, Cell.ALIVE)
-        game.set_cell(row + 2, col + 7, Cell.ALIVE)
+        game.stamp('diehard', row, col)
     
     @staticmethod
     def create_acorn(game, row, col):
         """Create an acorn methuselah pattern."""
-        game.set_cell(row, col + 1, Cell.ALIVE)
-        game.set_cell(row + 1, col + 3, Cell.ALIVE)
-        game.set_cell(row + 2, col, Cell.ALIVE)
-        game.set_cell(row + 2, col + 1, Cell.ALIVE)
-        game.set_cell(row + 2, col + 4, Cell.ALIVE)
-        game.set_cell(row + 2, col + 5, Cell.ALIVE)
-        game.set_cell(row + 2, col + 6, Cell.ALIVE)
+        game.stamp('acorn', row, col)
     
     # Gun patterns
     @staticmethod
     def create_gosper_glider_gun(game, row, col):
         """Create a Gosper glider gun pattern."""
-        # Left block
-        GameBoard.create_block(game, row + 5, col)
-        
-        # Left part
-        game.set_cell(row + 3, col + 10, Cell.ALIVE)
-        game.set_cell(row + 4, col + 10, Cell.ALIVE)
-        game.set_cell(row + 5, col + 10, Cell.ALIVE)
-        game.set_cell(row + 2, col + 11, Cell.ALIVE)
-        game.set_cell(row + 6, col + 11, Cell.ALIVE)
-        game.set_cell(row + 1, col + 12, Cell.ALIVE)
-        game.set_cell(row + 7, col + 12, Cell.ALIVE)
-        game.set_cell(row + 1, col + 13, Cell.ALIVE)
-        game.set_cell(row + 7, col + 13, Cell.ALIVE)
-        game.set_cell(row + 4, col + 14, Cell.ALIVE)
-        game.set_cell(row + 2, col + 15, Cell.ALIVE)
-        game.set_cell(row + 6, col + 15, Cell.ALIVE)
-        game.set_cell(row + 3, col + 16, Cell.ALIVE)
-        game.set_cell(row + 4, col + 16, Cell.ALIVE)
-        game.set_cell(row + 5, col + 16, Cell.ALIVE)
-        game.set_cell(row + 4, col + 17, Cell.ALIVE)
-        
-        # Right part
-        game.set_cell(row + 1, col + 20, Cell.ALIVE)
-        game.set_cell(row + 2, col + 20, Cell.ALIVE)
-        game.set_cell(row + 3, col + 20, Cell.ALIVE)
-        game.set_cell(row + 1, col + 21, Cell.ALIVE)
-        game.set_cell(row + 2, col + 21, Cell.ALIVE)
-        game.set_cell(row + 3, col + 21, Cell.ALIVE)
-        game.set_cell(row, col + 22, Cell.ALIVE)
-        game.set_cell(row + 4, col + 22, Cell.ALIVE)
-        game.set_cell(row - 1, col + 24, Cell.ALIVE)
-        game.set_cell(row, col + 24, Cell.ALIVE)
-        game.set_cell(row + 4, col + 24, Cell.ALIVE)
-        game.set_cell(row + 5, col + 24, Cell.ALIVE)
-        
-        # Right block
-        GameBoard.create_block(game, row + 3, col + 34)
+        game.stamp('gosper_glider_gun', row, col)
     
     @staticmethod
     def create_fur_elise_board():
@@ -6,14 +6,227 @@ It is expected to be thread-safe.
 '''
 
 import random
-import copy
-import hashlib
-import struct
+from functools import lru_cache
+from itertools import compress
+
+# NumPy is optional; when present it computes generations without per-cell Python loops
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# The Cython kernel is optional too; build it with `python setup.py build_ext --inplace`
+try:
+    import life_kernel
+    CYTHON_AVAILABLE = True
+except ImportError:
+    life_kernel = None
+    CYTHON_AVAILABLE = False
+
+# Numba is optional as well; it compiles the generation step to native code. Importing
+# it is slow, so it is only tried when the Cython kernel, which is preferred, is missing
+NUMBA_AVAILABLE = False
+if not CYTHON_AVAILABLE:
+    try:
+        import numba
+        NUMBA_AVAILABLE = NUMPY_AVAILABLE
+    except ImportError:
+        pass
 
 # Constants
 BOARD_WIDTH = 88  # Default width (matching piano keys)
 BOARD_HEIGHT = 40  # Default height
 
+# Translation tables between 0/1 cell bytes and ASCII binary digits, used to pack rows
+_CELLS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_CELLS = bytes.maketrans(b'01', b'\x00\x01')
+
+# Translation table from 0/1 cell bytes to the characters __str__ draws them with
+_CELLS_TO_TEXT = bytes.maketrans(b'\x00\x01', b'.O')
+
+_MASK64 = (1 << 64) - 1
+
+# Linear Congruential Generator parameters for the random top row (similar to Rust)
+_LCG_A = 1664525
+_LCG_C = 1013904223
+_LCG_MASK = 0xFFFFFFFF  # m = 2**32
+
+# Live cell offsets (row, col) of the named patterns, relative to the pattern's top-left
+_PATTERNS = {
+    # Still lifes
+    'block': ((0, 0), (0, 1), (1, 0), (1, 1)),
+    'beehive': ((0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 2)),
+    'loaf': ((0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 3), (3, 2)),
+    'boat': ((0, 0), (0, 1), (1, 0), (1, 2), (2, 1)),
+    # Oscillators
+    'blinker': ((0, 0), (0, 1), (0, 2)),
+    'toad': ((0, 1), (0, 2), (0, 3), (1, 0), (1, 1), (1, 2)),
+    'beacon': ((0, 0), (0, 1), (1, 0), (1, 1), (2, 2), (2, 3), (3, 2), (3, 3)),
+    'pulsar': (
+        (2, 4), (2, 5), (2, 6), (2, 10), (2, 11), (2, 12),
+        (4, 2), (4, 7), (4, 9), (4, 14),
+        (5, 2), (5, 7), (5, 9), (5, 14),
+        (6, 2), (6, 7), (6, 9), (6, 14),
+        (7, 4), (7, 5), (7, 6), (7, 10), (7, 11), (7, 12),
+        (9, 4), (9, 5), (9, 6), (9, 10), (9, 11), (9, 12),
+        (10, 2), (10, 7), (10, 9), (10, 14),
+        (11, 2), (11, 7), (11, 9), (11, 14),
+        (12, 2), (12, 7), (12, 9), (12, 14),
+        (14, 4), (14, 5), (14, 6), (14, 10), (14, 11), (14, 12),
+    ),
+    'pentadecathlon': (
+        (0, 1),
+        (1, 1),
+        (2, 1),
+        (3, 0), (3, 1), (3, 2),
+        (4, 0), (4, 1), (4, 2),
+        (5, 1),
+        (6, 1),
+        (7, 1),
+    ),
+    # Spaceships
+    'glider': ((0, 2), (1, 0), (1, 2), (2, 1), (2, 2)),
+    'lwss': ((0, 1), (0, 4), (1, 0), (2, 0), (2, 4), (3, 0), (3, 1), (3, 2), (3, 3)),
+    'mwss': (
+        (0, 2),
+        (1, 0), (1, 4),
+        (2, 5),
+        (3, 0), (3, 5),
+        (4, 1), (4, 2), (4, 3), (4, 4), (4, 5),
+    ),
+    'hwss': (
+        (0, 2), (0, 3),
+        (1, 0), (1, 5),
+        (2, 6),
+        (3, 0), (3, 6),
+        (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6),
+    ),
+    # Methuselahs
+    'r_pentomino': ((0, 1), (0, 2), (1, 0), (1, 1), (2, 1)),
+    'diehard': ((0, 6), (1, 0), (1, 1), (2, 1), (2, 5), (2, 6), (2, 7)),
+    'acorn': ((0, 1), (1, 3), (2, 0), (2, 1), (2, 4), (2, 5), (2, 6)),
+    # Guns
+    'gosper_glider_gun': (
+        (-1, 24),
+        (0, 22), (0, 24),
+        (1, 12), (1, 13), (1, 20), (1, 21),
+        (2, 11), (2, 15), (2, 20), (2, 21),
+        (3, 10), (3, 16), (3, 20), (3, 21), (3, 34), (3, 35),
+        (4, 10), (4, 14), (4, 16), (4, 17), (4, 22), (4, 24), (4, 34), (4, 35),
+        (5, 0), (5, 1), (5, 10), (5, 16), (5, 24),
+        (6, 0), (6, 1), (6, 11), (6, 15),
+        (7, 12), (7, 13),
+    ),
+}
+
+
+def _splitmix64(value):
+    """
+    Scramble an integer into 64 well-mixed bits with the SplitMix64 finalizer.
+    """
+    x = (value + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _lcg_jump_tables(count):
+    """
+    Return multipliers and increments that take an LCG seed straight to each of its
+    next count states: state i is (mults[i] * seed + incs[i]) mod 2**32.
+    """
+    mults, incs = [], []
+    a, c = 1, 0
+    for _ in range(count):
+        a, c = (a * _LCG_A) & _LCG_MASK, (c * _LCG_A + _LCG_C) & _LCG_MASK
+        mults.append(a)
+        incs.append(c)
+    return mults, incs
+
+
+_LCG_MULTS, _LCG_INCS = _lcg_jump_tables(BOARD_WIDTH)
+if NUMPY_AVAILABLE:
+    _LCG_MULTS_NP = np.array(_LCG_MULTS, dtype=np.uint64)
+    _LCG_INCS_NP = np.array(_LCG_INCS, dtype=np.uint64)
+
+
+def _pack_cells(cells):
+    """
+    Pack a sequence of 0/1 cells into an integer with cell i at bit i.
+    """
+    return int(bytes(cells).translate(_CELLS_TO_DIGITS)[::-1], 2)
+
+
+def _unpack_cells(bits, width):
+    """
+    Unpack an integer produced by _pack_cells back into bytes of width cells.
+    """
+    return format(bits, f'0{width}b')[::-1].encode().translate(_DIGITS_TO_CELLS)
+
+
+@lru_cache(maxsize=None)
+def _board_mask(height, width):
+    """
+    Packed mask of the board cells in a buffer of the given dimensions, halo excluded.
+    """
+    halo_row = bytes(width + 2)
+    return _pack_cells(halo_row + (b'\0' + b'\1' * width + b'\0') * height + halo_row)
+
+
+def _next_cells(above, mid, below, mask):
+    """
+    Compute the next state of packed cells from the same cells shifted to line
+    up with their neighbors above and below.
+    
+    The eight neighbors of every cell are summed at once with full adders
+    (sum = x ^ y ^ z, carry = (x & y) | (z & (x ^ y))), giving the count's
+    1s bit, 2s bit and a flag for counts of four or more in separate integers.
+    A cell is then alive when the count is 3, or 2 with the cell already alive.
+    Only the cells in mask are meaningful in the result.
+    """
+    # Neighbors to the left (shifted up one bit) and right (shifted down one bit);
+    # bits shifted past either edge are dropped, so the border counts as dead
+    n1, n2, n3 = (above << 1) & mask, above, above >> 1
+    n4, n5 = (mid << 1) & mask, mid >> 1
+    n6, n7, n8 = (below << 1) & mask, below, below >> 1
+    
+    # Sum the eight 1-bit inputs into 1s bits (weight 1) and carries (weight 2)
+    x = n1 ^ n2
+    s_a, c_a = x ^ n3, (n1 & n2) | (n3 & x)
+    x = n4 ^ n5
+    s_b, c_b = x ^ n6, (n4 & n5) | (n6 & x)
+    s_c, c_c = n7 ^ n8, n7 & n8
+    x = s_a ^ s_b
+    ones, c_d = x ^ s_c, (s_a & s_b) | (s_c & x)
+    
+    # Sum the four weight-2 carries into the 2s bit and a weight-4 overflow flag
+    x = c_a ^ c_b
+    t, u = x ^ c_c, (c_a & c_b) | (c_c & x)
+    twos, v = t ^ c_d, t & c_d
+    four_or_more = u | v
+    
+    return twos & ~four_or_more & (ones | mid)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, boundscheck=False)
+    def _step_numba(src, dst):
+        """
+        Write the next generation of src into dst, fusing the neighbor count and
+        the rules into one pass. Both arrays include the dead halo, so the eight
+        neighbors of every board cell are read without bounds checks. The board is
+        small enough that one thread beats the cost of starting parallel work.
+        """
+        height, width = src.shape
+        for r in range(1, height - 1):
+            for c in range(1, width - 1):
+                count = (src[r - 1, c - 1] + src[r - 1, c] + src[r - 1, c + 1] +
+                         src[r, c - 1] + src[r, c + 1] +
+                         src[r + 1, c - 1] + src[r + 1, c] + src[r + 1, c + 1])
+                dst[r, c] = 1 if count == 3 or (count == 2 and src[r, c] == 1) else 0
+
 
 class Cell:
     """
@@ -27,12 +240,15 @@ class Row:
     """
     Represents a single row of cells in the Game of Life.
     A live cell is represented by Cell.ALIVE, a dead cell by Cell.DEAD.
+    Cells are stored one byte each in a bytearray.
     """
+    __slots__ = ('cells',)
+
     def __init__(self, cells=None, width=BOARD_WIDTH):
         if cells is None:
-            self.cells = [Cell.DEAD] * width
+            self.cells = bytearray(width)  # All Cell.DEAD
         else:
-            self.cells = cells
+            self.cells = bytearray(cells)
 
     def get_cells(self):
         return self.cells
@@ -41,6 +257,12 @@ class Row:
         if 0 <= index < len(self.cells):
             self.cells[index] = value
 
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __iter__(self):
+        return iter(self.cells)
+
     def __len__(self):
         return len(self.cells)
 
@@ -49,18 +271,37 @@ class Life:
     """
     Implements Conway's Game of Life with a configurable board size.
     Board width is always 88 cells wide (matching piano keys) and height is configurable.
+    The board is one flat bytearray in row-major order, one byte per cell, surrounded
+    by a permanent one-cell dead halo. Rows are width + 2 bytes apart (the stride), so
+    the cell at (row, col) is self.board[(row + 1) * stride + col + 1]. The halo is
+    never written, which lets neighbor reads skip bounds checks.
     """
     def __init__(self, width=BOARD_WIDTH, height=BOARD_HEIGHT):
         # Always use exactly 88 cells for board width (matching piano keys)
         # This is a fixed requirement and cannot be changed
         self.width = BOARD_WIDTH
         self.height = height
-        self.board = []
+        self._stride = self.width + 2
         self.generation = 0
         
         # Initialize with an empty board - always use self.width (88) for row width
-        for _ in range(height):
-            self.board.append(Row([Cell.DEAD] * self.width))
+        self.board = self._empty_board()
+        
+        # Board the next generation is written into; swapped with self.board each step
+        self._back = self._empty_board()
+    
+    def _empty_board(self):
+        """
+        Create a board of dead cells, including the halo, with the current dimensions.
+        """
+        return bytearray(self._stride * (self.height + 2))
+    
+    def _row_starts(self):
+        """
+        Return the buffer offsets of the first cell of each board row.
+        """
+        stride = self._stride
+        return range(stride + 1, (self.height + 1) * stride, stride)
     
     def new_random_board(self, width=BOARD_WIDTH, height=BOARD_HEIGHT, alive_probability=0.2):
         """
@@ -71,16 +312,22 @@ class Life:
         # Width is always 88 cells (matching piano keys)
         self.width = BOARD_WIDTH
         self.height = height
+        self._stride = self.width + 2
         self.generation = 0
         
-        # Create a new board with random cells
-        board = []
-        for _ in range(height):
-            row_cells = [Cell.ALIVE if random.random() < alive_probability else Cell.DEAD 
-                         for _ in range(self.width)]
-            board.append(Row(row_cells))
+        # Create a new board with random cells inside the dead halo
+        self.board = self._empty_board()
+        if NUMPY_AVAILABLE:
+            # Draw the whole board in one call; booleans are stored as 0/1 bytes
+            alive = np.random.random((height, self.width)) < alive_probability
+            self._board_view(self.board)[1:-1, 1:-1] = alive
+        else:
+            width = self.width
+            for start in self._row_starts():
+                self.board[start:start + width] = bytes(random.random() < alive_probability
+                                                        for _ in range(width))
         
-        self.board = board
+        self._back = self._empty_board()
         return self
     
     def from_pattern(self, pattern):
@@ -90,23 +337,15 @@ class Life:
         'O', 'X', '*' for alive cells, any other character for dead cells.
         """
         # Reset the board to all dead cells
-        self.board = []
-        for _ in range(self.height):
-            self.board.append(Row([Cell.DEAD] * self.width))
+        self.board = self._empty_board()
         
         self.generation = 0
         
-        # Set alive cells based on the pattern
-        for row_idx, row_str in enumerate(pattern):
-            if row_idx >= self.height:
-                break
-                
-            for col_idx, ch in enumerate(row_str):
-                if col_idx >= self.width:
-                    break
-                    
-                if ch in ('O', 'X', '*'):
-                    self.set_cell(row_idx, col_idx, Cell.ALIVE)
+        # Set alive cells based on the pattern, one slice assignment per row
+        width = self.width
+        for start, row_str in zip(self._row_starts(), pattern):
+            cells = bytes(ch in ('O', 'X', '*') for ch in row_str[:width])
+            self.board[start:start + len(cells)] = cells
         
         return self
         
@@ -117,14 +356,11 @@ class Life:
         
         This is a simplified version. Use get_bottom_row_and_advance for more control.
         """
-        # Get the bottom row indices of live cells
-        bottom_row_keys = self.get_bottom_row_and_advance()
+        # Copy the bottom row's cell bytes straight into a Row
+        bottom = self.height * self._stride + 1
+        result_row = Row(self.board[bottom:bottom + self.width])
         
-        # Create a Row object with only the live cells marked
-        result_row = Row([Cell.DEAD] * self.width)
-        for idx in bottom_row_keys:
-            result_row.set_cell(idx, Cell.ALIVE)
-            
+        self._shift_and_advance()
         return result_row
     
     def get_bottom_row_and_advance(self):
@@ -136,52 +372,51 @@ class Life:
         Returns a list of indices (0-based) of live cells in the bottom row.
         """
         # Get indices of live cells in the bottom row
-        bottom_row_keys = []
-        for col in range(self.width):
-            if self.is_cell_alive(self.height - 1, col):
-                bottom_row_keys.append(col)
+        bottom = self.height * self._stride + 1
+        bottom_row_keys = list(compress(range(self.width), self.board[bottom:bottom + self.width]))
         
-        # Shift the board down one row
-        for row in range(self.height - 1, 0, -1):
-            for col in range(self.width):
-                cell_value = self.board[row - 1].get_cells()[col]
-                self.board[row].set_cell(col, cell_value)
+        self._shift_and_advance()
+        return bottom_row_keys
+    
+    def _shift_and_advance(self):
+        """
+        Shifts the board down one row, dropping the bottom row, adds a new random row
+        at the top and advances to the next generation.
+        """
+        width, stride, height = self.width, self._stride, self.height
+        board = self.board
+        
+        # Shift the board rows down one row (a single memmove; the halo columns
+        # that move along are dead) and clear the top row
+        board[2 * stride:(height + 1) * stride] = board[stride:height * stride]
+        board[stride + 1:stride + 1 + width] = bytes(width)
         
-        # Clear the top row
-        for col in range(self.width):
-            self.board[0].set_cell(col, Cell.DEAD)
-            
         # Add random cells to the top row
         self.add_random_top_row()
         
         # Calculate the next generation
         self.next_generation()
-        
-        return bottom_row_keys
     
     def add_random_top_row(self):
         """
         Adds random live cells to the top row of the board.
         Uses the current generation as a seed for deterministic randomness.
         """
-        # Create a hash of the current generation as a seed
-        seed = hashlib.md5(str(self.generation).encode()).digest()
-        seed_int = struct.unpack('Q', seed[:8])[0]  # Convert first 8 bytes to integer
+        # Mix the current generation into a seed; the LCG only uses its low 32 bits
+        seed = _splitmix64(self.generation) & _LCG_MASK
+        top = self._stride + 1  # Offset of the top row's first cell
         
-        # Use LCG algorithm similar to Rust implementation
-        rng_state = seed_int
-        for col in range(self.width):
-            # Linear Congruential Generator parameters
-            a = 1664525
-            c = 1013904223
-            m = 2**32
-            
-            # Update RNG state
-            rng_state = (a * rng_state + c) % m
-            
-            # Add a live cell with 1/5 probability (similar to Rust)
-            if rng_state % 5 == 0:
-                self.board[0].set_cell(col, Cell.ALIVE)
+        # Jump the LCG straight to the state for each column and add a live cell
+        # with 1/5 probability (similar to Rust)
+        if NUMPY_AVAILABLE:
+            states = (_LCG_MULTS_NP * np.uint64(seed) + _LCG_INCS_NP) & _LCG_MASK
+            row = np.frombuffer(self.board, dtype=np.uint8, count=self.width, offset=top)
+            row[states % 5 == 0] = Cell.ALIVE
+        else:
+            board = self.board
+            for col, (a, c) in enumerate(zip(_LCG_MULTS, _LCG_INCS)):
+                if ((a * seed + c) & _LCG_MASK) % 5 == 0:
+                    board[top + col] = Cell.ALIVE
     
     def next_generation(self):
         """
@@ -191,60 +426,107 @@ class Life:
         3. Any live cell with more than three live neighbors dies (overpopulation)
         4. Any dead cell with exactly three live neighbors becomes a live cell (reproduction)
         """
-        # Create a copy of the current board
-        new_board = copy.deepcopy(self.board)
+        self.advance(1)
+    
+    def advance(self, steps):
+        """
+        Advance the board by the given number of generations.
+        Each generation is written from self.board straight into self._back and the
+        two buffers are swapped, so nothing is allocated or converted per step.
+        """
+        # A Cython kernel was built on purpose and needs no JIT warm-up, so it wins
+        if CYTHON_AVAILABLE:
+            step = self._next_board_cython
+        elif NUMBA_AVAILABLE:
+            step = self._next_board_numba
+        elif NUMPY_AVAILABLE:
+            step = self._next_board_numpy
+        else:
+            step = self._next_board_bitwise
         
-        for row_idx in range(self.height):
-            for col_idx in range(self.width):
-                # Count the number of live neighbors
-                live_neighbors = self.count_live_neighbors(row_idx, col_idx)
-                
-                # Apply Conway's Game of Life rules
-                if self.is_cell_alive(row_idx, col_idx):
-                    # Cell is alive
-                    if live_neighbors < 2 or live_neighbors > 3:
-                        # Die due to underpopulation or overpopulation
-                        new_board[row_idx].set_cell(col_idx, Cell.DEAD)
-                else:
-                    # Cell is dead
-                    if live_neighbors == 3:
-                        # Become alive due to reproduction
-                        new_board[row_idx].set_cell(col_idx, Cell.ALIVE)
+        for _ in range(steps):
+            step(self.board, self._back)
+            
+            # Swap the boards; the old one is overwritten by the next generation
+            self.board, self._back = self._back, self.board
+            self.generation += 1
+    
+    def _next_board_bitwise(self, src, dst):
+        """
+        Compute the next generation of src into dst with bit-parallel integer
+        arithmetic. The whole buffer, halo included, is packed into one integer with
+        cell i at bit i, so every bitwise operation in _next_cells updates the whole
+        board at once; shifting by the stride lines each cell up with the row above
+        or below it. The halo cells are dead, so nothing leaks between rows.
+        """
+        stride = self._stride
+        mask = _board_mask(self.height, self.width)
+        cells = _pack_cells(src)
         
-        # Update the board
-        self.board = new_board
-        self.generation += 1
+        # The halo is masked off again, so it stays dead
+        new_cells = _next_cells(cells << stride, cells, cells >> stride, mask) & mask
+        dst[:] = _unpack_cells(new_cells, len(src))
+    
+    def _next_board_numpy(self, src, dst):
+        """
+        Compute the next generation of src into dst with NumPy array operations.
+        The halo supplies the dead border, which matches the edge behavior of
+        count_live_neighbors, and the 3x3 sums are built separably: three shifted
+        rows are added, then three shifted columns of that, four adds in all.
+        """
+        padded = self._board_view(src)
+        
+        vertical = padded[:-2] + padded[1:-1] + padded[2:]
+        block = vertical[:, :-2] + vertical[:, 1:-1] + vertical[:, 2:]
+        
+        # The block sum includes the cell itself: a dead cell is born at 3, and
+        # a live cell survives with 2 or 3 neighbors, i.e. a block sum of 3 or 4
+        alive = padded[1:-1, 1:-1] == Cell.ALIVE
+        self._board_view(dst)[1:-1, 1:-1] = (block == 3) | ((block == 4) & alive)
+    
+    def _next_board_numba(self, src, dst):
+        """
+        Compute the next generation of src into dst with the Numba-compiled kernel.
+        """
+        _step_numba(self._board_view(src), self._board_view(dst))
+    
+    def _next_board_cython(self, src, dst):
+        """
+        Compute the next generation of src into dst with the compiled Cython kernel,
+        which works on the flat buffers directly.
+        """
+        life_kernel.step(src, dst, self.height, self.width)
+    
+    def _board_view(self, buffer):
+        """
+        Return a (height + 2, width + 2) uint8 NumPy view of a board buffer,
+        halo included, without copying.
+        """
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(self.height + 2, self._stride)
     
     def count_live_neighbors(self, row, col):
         """
         Count the number of live neighbors for a cell at the given row and column.
         """
-        count = 0
-        
-        # Check all 8 neighboring cells
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                # Skip the cell itself
-                if dr == 0 and dc == 0:
-                    continue
-                
-                # Calculate the neighbor's position with boundary checking
-                nr = row + dr
-                nc = col + dc
-                
-                # Check boundaries (using edge behavior matching the Rust implementation)
-                if 0 <= nr < self.height and 0 <= nc < self.width:
-                    if self.is_cell_alive(nr, nc):
-                        count += 1
+        if 0 <= row < self.height and 0 <= col < self.width:
+            # The dead halo covers neighbors past the edges (matching the Rust
+            # implementation), so all eight are read at fixed offsets
+            board, stride = self.board, self._stride
+            i = (row + 1) * stride + col + 1
+            return (board[i - stride - 1] + board[i - stride] + board[i - stride + 1] +
+                    board[i - 1] + board[i + 1] +
+                    board[i + stride - 1] + board[i + stride] + board[i + stride + 1])
         
-        return count
+        # Off the board: count whichever neighbors are on it
+        return sum(self.is_cell_alive(row + dr, col + dc)
+                   for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
     
     def is_cell_alive(self, row, col):
         """
         Check if a cell at the given row and column is alive.
         """
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.board[row].get_cells()[col] == Cell.ALIVE
+            return self.board[(row + 1) * self._stride + col + 1] == Cell.ALIVE
         return False
     
     def set_cell(self, row, col, value):
@@ -252,7 +534,38 @@ class Life:
         Set the value of a cell at the given row and column.
         """
         if 0 <= row < self.height and 0 <= col < self.width:
-            self.board[row].set_cell(col, value)
+            self.board[(row + 1) * self._stride + col + 1] = value
+    
+    def set_region(self, row_start, row_end, col_start, col_end, value):
+        """
+        Set every cell in rows row_start to row_end - 1 and columns col_start to
+        col_end - 1 to value, one slice assignment per row. The region is clipped
+        to the board.
+        """
+        col_start, col_end = max(col_start, 0), min(col_end, self.width)
+        if col_start >= col_end:
+            return
+        cells = bytes([value]) * (col_end - col_start)
+        for start in self._row_starts()[max(row_start, 0):max(row_end, 0)]:
+            self.board[start + col_start:start + col_end] = cells
+    
+    def clear(self):
+        """
+        Set every cell on the board dead.
+        """
+        self.board[:] = bytes(len(self.board))
+    
+    def stamp(self, pattern_name, row, col):
+        """
+        Set the cells of a named pattern alive with its top-left corner at (row, col).
+        Cells that fall outside the board are skipped.
+        """
+        height, width, stride = self.height, self.width, self._stride
+        board = self.board
+        for dr, dc in _PATTERNS[pattern_name]:
+            r, c = row + dr, col + dc
+            if 0 <= r < height and 0 <= c < width:
+                board[(r + 1) * stride + c + 1] = Cell.ALIVE
     
     def get_cell(self, row, col):
         """
@@ -260,14 +573,15 @@ class Life:
         Returns Cell.DEAD if out of bounds.
         """
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.board[row].get_cells()[col]
+            return self.board[(row + 1) * self._stride + col + 1]
         return Cell.DEAD
     
     def get_board(self):
         """
-        Return a representation of the current board as a list of lists.
+        Return a snapshot of the current board as a list of lists.
         """
-        return [row.get_cells() for row in self.board]
+        width = self.width
+        return [list(self.board[start:start + width]) for start in self._row_starts()]
     
     def get_generation(self):
         """
@@ -279,18 +593,16 @@ class Life:
         """
         Return a string representation of the board.
         """
-        result = f"Generation: {self.generation}\n"
-        result += f"Piano Keys: 1-{self.width} (left to right)\n"
-        result += "=" * (self.width + 4) + "\n"
+        width = self.width
+        border = "=" * (width + 4)
+        lines = [f"Generation: {self.generation}",
+                 f"Piano Keys: 1-{width} (left to right)",
+                 border]
         
-        for row in self.board:
-            result += "| "
-            for cell in row.get_cells():
-                if cell == Cell.ALIVE:
-                    result += "O"
-                else:
-                    result += "."
-            result += " |\n"
+        # Draw each row in one translate call instead of one append per cell
+        board = self.board
+        lines += [f"| {board[start:start + width].translate(_CELLS_TO_TEXT).decode()} |"
+                  for start in self._row_starts()]
         
-        result += "=" * (self.width + 4)
-        return result
+        lines.append(border)
+        return "\n".join(lines)
@@ -18,6 +18,14 @@ ensure_config_in_path()
 from config import Config, BoardType, GenerationLimit
 from game_board import GameBoard
 
+# Visualization symbol for every piano key: bass, middle and treble ranges
+KEY_SYMBOLS = "♭" * 30 + "♪" * 30 + "♯" * 28
+
+
+def show_keys(keys):
+    """Show a generation's keys as a '♫' followed by one symbol per key played."""
+    sys.stdout.write("♫" + "".join([KEY_SYMBOLS[key] for key in keys]))
+
 
 def main():
     """
@@ -35,7 +43,8 @@ def main():
     generations = None if not config.generations.is_limited else config.generations.limit
     
     # Create a piano with configured settings
-    piano = Piano(generations=generations, audio_enabled=not config.silent)
+    piano = Piano(generations=generations, audio_enabled=not config.silent,
+                  on_keys_played=show_keys, on_generation_end=sys.stdout.flush)
     
     # Initialize the game board based on configuration
     if config.board_type == BoardType.FUR_ELISE:
@@ -66,41 +75,11 @@ def main():
     print("Each '♪' represents a key being played.")
     print("-" * 60)
     
-    # Replace the standard output with a visual representation
-    original_print = print
-    
-    def piano_print(message):
-        if "Playing key" in message:
-            try:
-                key_num = int(message.split("Playing key ")[1])
-                # Use different symbols based on the key position (bass, middle, treble)
-                if key_num < 30:
-                    original_print("♭", end="")
-                elif key_num < 60:
-                    original_print("♪", end="")
-                else:
-                    original_print("♯", end="")
-            except (IndexError, ValueError):
-                # Handle case where the message format doesn't match expected pattern
-                original_print(message)
-        elif "Playing keys:" in message:
-            # Handle multiple keys being played
-            original_print("♫", end="")
-        else:
-            original_print(message)
-    
-    # Replace the built-in print function temporarily
-    import builtins
-    builtins.print = piano_print
-    
     try:
         # Play the piano
         piano.play()
     except KeyboardInterrupt:
-        original_print("\nPerformance interrupted by user.")
-    finally:
-        # Restore the original print function
-        builtins.print = original_print
+        print("\nPerformance interrupted by user.")
     
     print("\n" + "-" * 60)
     print("Performance complete!")
@@ -7,9 +7,25 @@ It is implemented following a similar approach to the Rust version of Conway's S
 
 import time
 import os
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import compress, cycle
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from life import Life, Row
+from typing import Callable, Dict, List, Optional, Tuple
+from life import Life, Row, BOARD_WIDTH
+from game_board import GameBoard
+
+# Piano samples ship in static/audio at the project root; found from this file so
+# they load whatever the working directory is
+AUDIO_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         os.pardir, "static", "audio"))
+
+# Number of notes the mixer can sound at once
+MIXER_CHANNELS = 16
+
+# Note name of every key (A0=0, A#0=1, B0=2, C0=3, ...), with the octave counted from A
+_NOTE_NAMES = ("A", "A#", "B", "C", "C#", "D", "D#", "E", "F", "F#", "G", "G#")
+_KEY_NOTE_NAMES = tuple(f"{_NOTE_NAMES[key % 12]}{key // 12}" for key in range(128))
 
 # Define a dummy pygame module for type hints
 class DummyPygame:
@@ -25,6 +41,81 @@ except ImportError:
     PYGAME_AVAILABLE = False
     print("Warning: pygame not available, using NullAudioEngine instead")
 
+# NumPy is optional; it pitch-shifts the samples to each key's own pitch
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+def _chord_pattern(sorted_keys) -> bool:
+    """
+    Check ascending keys for a triad or a dense cluster of notes.
+    Works on a list or, compiled by Numba, on an integer array.
+    """
+    n = len(sorted_keys)
+    
+    # Check for triads (3 notes)
+    for i in range(n - 2):
+        root = sorted_keys[i]
+        third = sorted_keys[i + 1]
+        fifth = sorted_keys[i + 2]
+        
+        interval1 = third - root
+        interval2 = fifth - root
+        
+        # Major chord: 4 and 7 semitones
+        # Minor chord: 3 and 7 semitones
+        # Diminished chord: 3 and 6 semitones
+        # Augmented chord: 4 and 8 semitones
+        if (interval1 == 3 or interval1 == 4) and (6 <= interval2 <= 8):
+            return True
+    
+    # Check for dense clusters (many consecutive notes)
+    if n >= 5:
+        consecutive_count = 1
+        for i in range(1, n):
+            if sorted_keys[i] - sorted_keys[i - 1] <= 2:
+                consecutive_count += 1
+                if consecutive_count >= 5:
+                    return True
+            else:
+                consecutive_count = 1
+    
+    return False
+
+
+@lru_cache(maxsize=1)
+def _chord_pattern_kernel() -> Callable[[List[int]], bool]:
+    """
+    Return the chord-pattern scan for sorted keys, compiled by Numba when it is installed.
+    Numba is optional and slow to import, so it is only loaded on the first chord check.
+    """
+    if NUMPY_AVAILABLE:
+        try:
+            import numba
+        except ImportError:
+            pass
+        else:
+            compiled = numba.njit(cache=True)(_chord_pattern)
+            return lambda sorted_keys: compiled(np.array(sorted_keys, dtype=np.int64))
+    return _chord_pattern
+
+
+def _pitch_shift(frames, semitones: int):
+    """
+    Resample an array of audio frames (one row per frame) so that played back at
+    the same rate it sounds the given number of semitones higher, or lower if negative.
+    """
+    ratio = 2.0 ** (semitones / 12.0)
+    positions = np.arange(int(len(frames) / ratio)) * ratio
+    frame_index = np.arange(len(frames))
+    channels = frames.reshape(len(frames), -1)
+    shifted = np.column_stack([np.interp(positions, frame_index, channels[:, c])
+                               for c in range(channels.shape[1])])
+    return shifted.reshape((len(positions),) + frames.shape[1:]).astype(frames.dtype)
+
 
 class AudioPlayer(ABC):
     """
@@ -55,9 +146,21 @@ class AudioEngine(AudioPlayer):
     def __init__(self):
         self.sample_cache: Dict[int, pygame.mixer.Sound] = {}
         
+        # Sorted sample keys and the per-key sample choice, filled in once the samples are loaded
+        self._sorted_sample_keys: Tuple[int, ...] = ()
+        self._closest_key_table: List[Optional[int]] = []
+        
+        # Samples shifted to each key's pitch, rendered the first time the key is played
+        self._rendered: Dict[int, pygame.mixer.Sound] = {}
+        
         # Initialize pygame mixer if available
         if PYGAME_AVAILABLE:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+            
+            # Play on a fixed pool of channels in turn instead of having pygame look
+            # for a free channel on every play; the oldest note is the one cut off
+            pygame.mixer.set_num_channels(MIXER_CHANNELS)
+            self._channels = cycle([pygame.mixer.Channel(i) for i in range(MIXER_CHANNELS)])
             self._load_samples()
         else:
             print("AudioEngine initialized but pygame not available")
@@ -65,61 +168,70 @@ class AudioEngine(AudioPlayer):
     def _load_samples(self) -> None:
         """Load piano sample files."""
         # Piano key mapping: A0=0, A#0=1, B0=2, C1=3, C#1=4, D1=5, D#1=6, E1=7, F1=8, F#1=9, G1=10, G#1=11, A1=12...
+        # Sample files for each key, preferred first; alternatives are only loaded
+        # if the files before them are missing or fail to load
         sample_files = [
             # Low range samples
-            (9, "../static/audio/piano_a1.wav"),      # A1 (key 9)
-            (21, "../static/audio/piano_a2.wav"),     # A2 (key 21)
-            (24, "../static/audio/piano_c2.wav"),     # C2 (key 24)
+            (9, ["piano_a1.wav"]),        # A1 (key 9)
+            (21, ["piano_a2.wav"]),       # A2 (key 21)
+            (24, ["piano_c2.wav"]),       # C2 (key 24)
             
             # Mid-low range (Octave 3) - Better chromatic coverage
-            (36, "../static/audio/piano_c3.wav"),     # C3 (key 36)
-            (38, "../static/audio/piano_d3.wav"),     # D3 (key 38)
-            (41, "../static/audio/piano_f3.wav"),     # F3 (key 41)
-            (43, "../static/audio/piano_g3.wav"),     # G3 (key 43)
+            (36, ["piano_c3_kawai.wav",   # C3 (key 36)
+                  "piano_c3.wav"]),
+            (38, ["piano_d3.wav"]),       # D3 (key 38)
+            (41, ["piano_f3.wav"]),       # F3 (key 41)
+            (43, ["piano_g3.wav"]),       # G3 (key 43)
             
             # Mid range (Octave 4) - Even better coverage
-            (48, "../static/audio/piano_c4_ivory.wav"), # C4 (key 48) - Best quality
-            (50, "../static/audio/piano_d4.wav"),     # D4 (key 50)
-            (53, "../static/audio/piano_f4.wav"),     # F4 (key 53)
-            (55, "../static/audio/piano_g4.wav"),     # G4 (key 55)
-            
-            # Alternative samples for comparison/backup
-            (36, "../static/audio/piano_c3_kawai.wav"), # Alternative C3
-            (48, "../static/audio/piano_c4.wav"),     # Alternative C4
-            (48, "../static/audio/piano_c4_kawai.wav"), # Another C4 option
+            (48, ["piano_c4_kawai.wav",   # C4 (key 48)
+                  "piano_c4.wav",
+                  "piano_c4_ivory.wav"]),
+            (50, ["piano_d4.wav"]),       # D4 (key 50)
+            (53, ["piano_f4.wav"]),       # F4 (key 53)
+            (55, ["piano_g4.wav"]),       # G4 (key 55)
             
             # Upper range samples
-            (60, "../static/audio/piano_c5.wav"),     # C5 (key 60)
-            (72, "../static/audio/piano_c6.wav"),     # C6 (key 72)
-            (84, "../static/audio/piano_c7.wav"),     # C7 (key 84)
+            (60, ["piano_c5.wav"]),       # C5 (key 60)
+            (72, ["piano_c6.wav"]),       # C6 (key 72)
+            (84, ["piano_c7.wav"]),       # C7 (key 84)
         ]
         
-        for key, file_path in sample_files:
-            if os.path.exists(file_path):
+        for key, file_names in sample_files:
+            for file_name in file_names:
+                file_path = os.path.join(AUDIO_DIR, file_name)
+                if not os.path.exists(file_path):
+                    print(f"Could not find sample file: {file_path}")
+                    continue
                 try:
                     sound = pygame.mixer.Sound(file_path)
-                    self.sample_cache[key] = sound
-                    note_name = self._key_to_note_name(key)
-                    print(f"Loaded sample for key {key} ({note_name}): {file_path}")
                 except Exception as e:
                     print(f"Failed to load sample file: {file_path} - {e}")
-            else:
-                print(f"Could not find sample file: {file_path}")
+                    continue
+                self.sample_cache[key] = sound
+                note_name = self._key_to_note_name(key)
+                print(f"Loaded sample for key {key} ({note_name}): {file_path}")
+                break
         
         print(f"Loaded {len(self.sample_cache)} piano samples")
+        self._build_sample_table()
         self._print_coverage_analysis()
     
-    def _key_to_note_name(self, key: int) -> str:
-        """Convert key number to note name (e.g. 48 -> 'C4')."""
-        note_names = ["A", "A#", "B", "C", "C#", "D", "D#", "E", "F", "F#", "G", "G#"]
-        octave = key // 12
-        note_in_octave = key % 12
-        return f"{note_names[note_in_octave]}{octave}"
+    def _build_sample_table(self) -> None:
+        """Precompute the chosen sample key for every piano key."""
+        self._sorted_sample_keys = tuple(sorted(self.sample_cache))
+        self._closest_key_table = [self._closest_sample_key(key) for key in range(BOARD_WIDTH)]
+        self._rendered = {}
+    
+    @staticmethod
+    def _key_to_note_name(key: int) -> str:
+        """Convert key number to note name (e.g. 48 -> 'A4')."""
+        return _KEY_NOTE_NAMES[key]
     
     def _print_coverage_analysis(self) -> None:
         """Print analysis of sample coverage."""
         print("=== Chromatic Coverage Analysis ===")
-        keys = sorted(self.sample_cache.keys())
+        keys = self._sorted_sample_keys
         
         for key in keys:
             note_name = self._key_to_note_name(key)
@@ -139,30 +251,51 @@ class AudioEngine(AudioPlayer):
         else:
             print("Excellent chromatic coverage - no major gaps!")
     
-    def _get_sample_for_key(self, key: int) -> Optional[pygame.mixer.Sound]:
-        """Find the closest available sample with intelligent chromatic selection."""
-        available_keys = list(self.sample_cache.keys())
-        if not available_keys:
+    def _get_sample_for_key(self, key: int) -> Tuple[Optional[pygame.mixer.Sound], Optional[int]]:
+        """
+        Find the closest available sample with intelligent chromatic selection.
+        Returns the sample and the key it was recorded at, or (None, None) without samples.
+        """
+        if 0 <= key < len(self._closest_key_table):
+            closest_key = self._closest_key_table[key]
+        else:
+            closest_key = self._closest_sample_key(key)
+        return self.sample_cache.get(closest_key), closest_key
+    
+    def _closest_sample_key(self, key: int) -> Optional[int]:
+        """Pick the sample key best suited to play the given key, or None without samples."""
+        sample_keys = self._sorted_sample_keys
+        if not sample_keys:
             return None
         
-        # Advanced sample selection algorithm for better chromatic coverage
-        def key_distance_score(sample_key: int) -> int:
-            distance = abs(sample_key - key)
-            
-            # Chromatic optimization: prefer samples that result in better pitch shifts
-            if distance == 0:
-                return 0  # Perfect match
-            elif distance <= 2:
-                return distance  # Minimal shift penalty (within major second)
-            elif distance <= 6:
-                return distance + 1  # Slight penalty for larger shifts (up to tritone)
-            elif distance <= 12:
-                return distance * 2  # Higher penalty for shifts over an octave
-            else:
-                return distance * 3  # Very high penalty for extreme shifts
+        # The score only grows with distance, so the best sample is one of the two
+        # neighbours of key; on a tie the lower one wins
+        idx = bisect_left(sample_keys, key)
+        if idx == 0:
+            return sample_keys[0]
+        if idx == len(sample_keys):
+            return sample_keys[-1]
+        below, above = sample_keys[idx - 1], sample_keys[idx]
+        if self._key_distance_score(above, key) < self._key_distance_score(below, key):
+            return above
+        return below
+    
+    @staticmethod
+    def _key_distance_score(sample_key: int, key: int) -> int:
+        """Advanced sample selection score for better chromatic coverage; lower is better."""
+        distance = abs(sample_key - key)
         
-        closest_key = min(available_keys, key=key_distance_score)
-        return self.sample_cache.get(closest_key)
+        # Chromatic optimization: prefer samples that result in better pitch shifts
+        if distance == 0:
+            return 0  # Perfect match
+        elif distance <= 2:
+            return distance  # Minimal shift penalty (within major second)
+        elif distance <= 6:
+            return distance + 1  # Slight penalty for larger shifts (up to tritone)
+        elif distance <= 12:
+            return distance * 2  # Higher penalty for shifts over an octave
+        else:
+            return distance * 3  # Very high penalty for extreme shifts
     
     def _play_sample(self, key: int) -> None:
         """Play a sample for the given key with pitch adjustment."""
@@ -170,19 +303,30 @@ class AudioEngine(AudioPlayer):
             print(f"Would play key {key} ({self._key_to_note_name(key)})")
             return
             
-        sample = self._get_sample_for_key(key)
-        if sample:
-            # In a real implementation, we would adjust pitch and volume like in the Rust version
-            # Here we just play the closest sample
-            closest_key = min(self.sample_cache.keys(), key=lambda k: abs(k - key))
-            semitone_difference = key - closest_key
-            
-            if abs(semitone_difference) > 0.1:
-                print(f"Key {key}: using sample {closest_key} (shift: {semitone_difference} semitones)")
-            
-            sample.play()
-        else:
-            print(f"No sample available for key {key}")
+        sample = self._rendered.get(key)
+        if sample is None:
+            sample = self._render_sample(key)
+            if sample is None:
+                print(f"No sample available for key {key}")
+                return
+        next(self._channels).play(sample)
+    
+    def _render_sample(self, key: int) -> Optional[pygame.mixer.Sound]:
+        """Shift the closest sample to the key's pitch and keep it for later plays."""
+        sample, closest_key = self._get_sample_for_key(key)
+        if sample is None:
+            return None
+        
+        semitone_difference = key - closest_key
+        if semitone_difference:
+            print(f"Key {key}: using sample {closest_key} (shift: {semitone_difference} semitones)")
+            # Without NumPy the closest sample is played unshifted
+            if NUMPY_AVAILABLE:
+                frames = _pitch_shift(pygame.sndarray.array(sample), semitone_difference)
+                sample = pygame.sndarray.make_sound(frames)
+        
+        self._rendered[key] = sample
+        return sample
     
     def _is_chord_pattern(self, keys: List[int]) -> bool:
         """Detect if the keys form a chord pattern."""
@@ -190,37 +334,7 @@ class AudioEngine(AudioPlayer):
             return False
         
         # Check for common chord patterns
-        sorted_keys = sorted(keys)
-        
-        # Check for triads (3 notes)
-        if len(sorted_keys) >= 3:
-            for i in range(len(sorted_keys) - 2):
-                root = sorted_keys[i]
-                third = sorted_keys[i+1]
-                fifth = sorted_keys[i+2]
-                
-                interval1 = third - root
-                interval2 = fifth - root
-                
-                # Major chord: 4 and 7 semitones
-                # Minor chord: 3 and 7 semitones
-                # Diminished chord: 3 and 6 semitones
-                # Augmented chord: 4 and 8 semitones
-                if (interval1 == 3 or interval1 == 4) and (6 <= interval2 <= 8):
-                    return True
-        
-        # Check for dense clusters (many consecutive notes)
-        if len(sorted_keys) >= 5:
-            consecutive_count = 1
-            for i in range(1, len(sorted_keys)):
-                if sorted_keys[i] - sorted_keys[i-1] <= 2:
-                    consecutive_count += 1
-                    if consecutive_count >= 5:
-                        return True
-                else:
-                    consecutive_count = 1
-        
-        return False
+        return _chord_pattern_kernel()(sorted(keys))
     
     def play_piano_keys(self, keys: List[int]) -> None:
         """Play multiple piano keys with slight delays between them."""
@@ -290,7 +404,9 @@ class Piano:
     Conway's Game of Life patterns.
     """
     def __init__(self, generations: Optional[int] = 10, width: int = 88, height: int = 40, 
-                 audio_enabled: bool = True):
+                 audio_enabled: bool = True,
+                 on_keys_played: Optional[Callable[[List[int]], None]] = None,
+                 on_generation_end: Optional[Callable[[], None]] = None):
         """
         Initialize a Piano instance.
         
@@ -299,6 +415,8 @@ class Piano:
             width: Width of the Life board (default 88, matching piano keys)
             height: Height of the Life board
             audio_enabled: Whether to use audio output (True) or silent mode (False)
+            on_keys_played: Called with each generation's keys just before they are played
+            on_generation_end: Called once each generation has been played
         """
         self.generations = generations
         self.width = width
@@ -306,6 +424,8 @@ class Piano:
         self.is_muted = False
         self.delay_ms = 200  # Default delay between generations
         self.game = Life(width=width, height=height)
+        self._on_keys_played: Callable[[List[int]], None] = on_keys_played or (lambda keys: None)
+        self._on_generation_end: Callable[[], None] = on_generation_end or (lambda: None)
         
         # Choose appropriate audio engine
         if audio_enabled and PYGAME_AVAILABLE:
@@ -313,6 +433,18 @@ class Piano:
         else:
             self.audio_engine = NullAudioEngine()
     
+    @property
+    def delay_ms(self) -> int:
+        """
+        Delay between generations in milliseconds.
+        """
+        return self._delay_ms
+
+    @delay_ms.setter
+    def delay_ms(self, value: int) -> None:
+        self._delay_ms = value
+        self._delay_s = value / 1000.0
+
     def play(self) -> None:
         """
         Execute the game for the specified number of generations.
@@ -332,35 +464,49 @@ class Piano:
         Play the piano indefinitely until interrupted.
         """
         gen_count = 0
+        deadline = time.monotonic()
         while True:
             self._play_generation()
             gen_count += 1
             print(f"\rGeneration {gen_count}", end="")
-            time.sleep(self.delay_ms / 1000)
+            deadline = self._wait_until_next(deadline)
     
     def _play_limited(self, count: int) -> None:
         """
         Play the piano for a specified number of generations.
         """
+        deadline = time.monotonic()
         for gen in range(count):
             self._play_generation()
             if gen < count - 1:  # Don't delay after the last generation
-                time.sleep(self.delay_ms / 1000)
+                deadline = self._wait_until_next(deadline)
+
+    def _wait_until_next(self, deadline: float) -> float:
+        """
+        Sleep until one step delay after the previous generation's deadline, so the
+        time spent playing a generation counts towards the delay instead of adding
+        to it. Returns the new deadline; if playing ran past it the schedule restarts
+        from now rather than rushing the following generations to catch up.
+        """
+        deadline += self._delay_s
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            return deadline
+        return time.monotonic()
     
     def _play_generation(self) -> None:
         """
         Play a single generation: get bottom row, play notes, advance.
         """
         # Use the GameBoard utility method to get bottom row and advance the game
-        from game_board import GameBoard
         bottom_row_keys = GameBoard.get_bottom_row_and_advance(self.game)
         
         # Play notes corresponding to live cells
         if not self.is_muted and bottom_row_keys:
-            print(f"Playing keys: {bottom_row_keys}")
-            for key in bottom_row_keys:
-                print(f"Playing key {key}")
+            self._on_keys_played(bottom_row_keys)
             self.audio_engine.play_piano_keys(bottom_row_keys)
+        self._on_generation_end()
     
     def _row_to_keys(self, row: Row) -> List[int]:
         """
@@ -373,7 +519,17 @@ class Piano:
             List of key indices (0-87) where cells are alive (1)
         """
         cells = row.get_cells()
-        return [i for i, cell in enumerate(cells) if cell == 1]
+        # compress scans the 0/1 cell bytes in C, keeping indices of live cells
+        return list(compress(range(len(cells)), cells))
+    
+    def set_keys_played_callback(self, callback: Callable[[List[int]], None]) -> None:
+        """
+        Set the function called with each generation's keys just before they are played.
+        
+        Args:
+            callback: Function taking the list of key indices (0-87) being played
+        """
+        self._on_keys_played = callback
     
     def set_mute(self, mute: bool = True) -> None:
         """
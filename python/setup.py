@@ -0,0 +1,18 @@
+#!/bin/python3
+
+'''
+Builds the optional Cython generation kernel (life_kernel.pyx) next to life.py:
+
+    python setup.py build_ext --inplace
+
+The game runs without it, falling back to Numba, NumPy or pure Python.
+'''
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name="conways-steinway-kernel",
+    py_modules=[],
+    ext_modules=cythonize([Extension("life_kernel", ["life_kernel.pyx"])]),
+)
@@ -1,12 +1,8 @@
 #!/bin/python3
 
-import sys
-import os
 import pytest
 
-# Add the parent directory to sys.path to be able to import the modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+import piano as piano_module
 from piano import AudioEngine, NullAudioEngine, AudioPlayer
 
 def test_audio_player_interface():
@@ -66,3 +62,46 @@ def test_audio_engine_key_to_note_name():
     assert engine._key_to_note_name(48) == "A4"
     assert engine._key_to_note_name(51) == "C4"  # Middle C is actually 51 in our mapping
     assert engine._key_to_note_name(87) == "C7"  # Highest piano key in our implementation
+
+@pytest.mark.skipif(not piano_module.NUMPY_AVAILABLE, reason="numpy not installed")
+def test_pitch_shift_resamples_frames():
+    """Test that pitch shifting resamples stereo frames by the semitone ratio."""
+    import numpy as np
+    frames = np.arange(2000, dtype=np.int16).reshape(1000, 2)
+    
+    # An octave up plays every other frame, an octave down interpolates between frames
+    up = piano_module._pitch_shift(frames, 12)
+    assert up.dtype == np.int16 and up.shape == (500, 2)
+    assert (up == frames[::2]).all()
+    
+    down = piano_module._pitch_shift(frames, -12)
+    assert down.shape == (2000, 2)
+    assert (down[::2][:999] == frames[:999]).all()
+    assert (piano_module._pitch_shift(frames, 0) == frames).all()
+
+def test_audio_engine_reuses_rendered_samples():
+    """Test that a key's shifted sample is rendered once and reused afterwards."""
+    engine = AudioEngine()
+    if not engine.sample_cache:
+        pytest.skip("piano samples not available")
+    
+    engine._play_sample(49)
+    rendered = engine._rendered[49]
+    engine._play_sample(49)
+    assert engine._rendered[49] is rendered
+    
+    # Keys with a sample of their own play it unshifted
+    engine._play_sample(48)
+    assert engine._rendered[48] is engine.sample_cache[48]
+
+def test_audio_engine_plays_on_channel_pool():
+    """Test that notes are played on the engine's pool of mixer channels in turn."""
+    engine = AudioEngine()
+    if not piano_module.PYGAME_AVAILABLE:
+        pytest.skip("pygame not installed")
+    
+    import pygame
+    assert pygame.mixer.get_num_channels() == piano_module.MIXER_CHANNELS
+    channels = [next(engine._channels) for _ in range(piano_module.MIXER_CHANNELS + 1)]
+    assert len(set(channels[:-1])) == piano_module.MIXER_CHANNELS
+    assert channels[-1] == channels[0]
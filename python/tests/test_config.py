@@ -0,0 +1,15 @@
+#!/bin/python3
+
+from config import Config, BoardType
+
+def test_load_from_file_with_windows_line_endings(tmp_path):
+    """Test that a properties file with CRLF line endings loads every value."""
+    config_file = tmp_path / "conways_steinway.properties"
+    config_file.write_bytes(b"board.type=complex\r\ngenerations=5\r\naudio.detect.chords=false\r\n")
+    
+    config = Config()
+    config.load_from_file(config_file)
+    
+    assert config.board_type == BoardType.COMPLEX
+    assert str(config.generations) == "Limited(5)"
+    assert config.detect_chords is False
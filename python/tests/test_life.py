@@ -1,21 +1,23 @@
 #!/bin/python3
 
-import sys
-import os
 import pytest
+import random
 
-# Add the parent directory to sys.path to be able to import the modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+import life as life_module
 from life import Life, Row
 
+@pytest.fixture
+def life5():
+    """An empty 5-row board."""
+    return Life(height=5)
+
 def test_life_initialization():
     """Test that a Life instance can be created with default parameters."""
     life = Life()
     assert life.width == 88
     assert life.height == 40
-    assert len(life.board) == 40
-    assert len(life.board[0]) == 88
+    assert len(life.get_board()) == 40
+    assert len(life.get_board()[0]) == 88
 
 def test_custom_board_size():
     """Test that a Life instance can be created with custom height but always has 88-cell width."""
@@ -23,41 +25,51 @@ def test_custom_board_size():
     # Width should always be 88 to match piano keys, regardless of what's passed
     assert life.width == 88
     assert life.height == 5
-    assert len(life.board) == 5
-    assert len(life.board[0]) == 88
+    assert len(life.get_board()) == 5
+    assert len(life.get_board()[0]) == 88
 
-def test_get_row():
+def test_get_row(life5):
     """Test that get_row() returns the bottom row and adds a new row at the top."""
-    life = Life(height=5)
+    life = life5
     
     # Set a pattern in the bottom row to check
-    for i in range(88):
-        life.set_cell(4, i, 1)  # Set all cells in bottom row to 1
+    life.set_region(4, 5, 0, 88, 1)  # Set all cells in bottom row to 1
     
     # Get the row and check it
     removed_row = life.get_row()
     assert len(removed_row) == 88
-    assert all(cell == 1 for cell in removed_row.get_cells())
+    assert removed_row.get_cells() == bytes([1]) * 88
+    assert list(removed_row) == [1] * 88 and removed_row[87] == 1
     
     # Check that the board still has the correct dimensions
-    assert len(life.board) == 5
-    assert len(life.board[0]) == 88
+    assert len(life.get_board()) == 5
+    assert len(life.get_board()[0]) == 88
     
     # In our implementation, we add a new empty row at the top and then 
     # calculate the next generation which will modify it, so we can't 
     # assume all cells will be 0. Let's skip this check.
-    # Instead, verify the row was added by checking it exists
-    assert isinstance(life.board[0], Row)
+    # Instead, verify the removed row is returned as a Row
+    assert isinstance(removed_row, Row)
 
-def test_next_generation():
-    """Test that the next_generation method correctly applies Conway's rules."""
-    # Create a board for testing (width will always be 88)
-    life = Life(height=5)
+def test_bottom_row_advance_shifts_board_down():
+    """Test that get_bottom_row_and_advance moves every row down by one."""
+    life = Life(height=8)
+    life.stamp('block', 5, 40)
+    for col in (3, 7, 11):
+        life.set_cell(7, col, 1)
     
-    # Clear the board
-    for r in range(5):
-        for c in range(88):
-            life.set_cell(r, c, 0)
+    assert life.get_bottom_row_and_advance() == [3, 7, 11]
+    
+    # The block is a still life, so after the shift it sits one row lower
+    board = life.get_board()
+    for row in (6, 7):
+        assert board[row][39:43] == [0, 1, 1, 0]
+    assert board[5][39:43] == [0, 0, 0, 0]
+
+def test_next_generation(life5):
+    """Test that the next_generation method correctly applies Conway's rules."""
+    # An empty board for testing (width will always be 88)
+    life = life5
     
     # Set up a blinker pattern (vertical line of 3 cells) in the middle of the board
     middle_col = 44  # Middle of 88-width board
@@ -75,10 +87,109 @@ def test_next_generation():
     next_state = life.get_board()
     
     # Check that the middle row has 3 live cells horizontally
-    assert next_state[2][middle_col-1] == 1
-    assert next_state[2][middle_col] == 1
-    assert next_state[2][middle_col+1] == 1
+    assert next_state[2][middle_col-1:middle_col+2] == [1, 1, 1]
+    
+    # Check that the vertical cells are now dead, and nothing else is alive
+    assert [next_state[1][middle_col], next_state[3][middle_col]] == [0, 0]
+    assert sum(map(sum, next_state)) == 3
+
+def expected_next_board(life):
+    """Compute the next board cell by cell, straight from Conway's rules."""
+    expected = []
+    for r in range(life.height):
+        row = []
+        for c in range(life.width):
+            neighbors = life.count_live_neighbors(r, c)
+            alive = neighbors == 3 or (neighbors == 2 and life.is_cell_alive(r, c))
+            row.append(1 if alive else 0)
+        expected.append(row)
+    return expected
+
+@pytest.mark.parametrize("kernel", ["bitwise", "numpy", "numba", "life_kernel"])
+def test_generation_kernels_match_rules(kernel, monkeypatch):
+    """Test that each generation kernel follows Conway's rules on a random board."""
+    if kernel != "bitwise":
+        pytest.importorskip(kernel)
+    if kernel == "numba" and not hasattr(life_module, "_step_numba"):
+        pytest.skip("Numba kernel is not compiled when the Cython kernel is built")
+    monkeypatch.setattr(life_module, "NUMBA_AVAILABLE", kernel == "numba")
+    monkeypatch.setattr(life_module, "CYTHON_AVAILABLE", kernel == "life_kernel")
+    monkeypatch.setattr(life_module, "NUMPY_AVAILABLE", kernel in ("numpy", "numba"))
+    
+    # Seed the board directly, since new_random_board draws from np.random under NumPy
+    life = Life(height=12)
+    rng = random.Random(1234)
+    for r in range(12):
+        for c in range(life.width):
+            life.set_cell(r, c, rng.random() < 0.35)
     
-    # Check that the vertical cells are now dead
-    assert next_state[1][middle_col] == 0
-    assert next_state[3][middle_col] == 0
+    for _ in range(5):
+        expected = expected_next_board(life)
+        life.next_generation()
+        assert life.get_board() == expected
+    
+    # Advancing several generations at once matches stepping one at a time
+    stepped = Life(height=12)
+    for r, row in enumerate(life.get_board()):
+        for c, cell in enumerate(row):
+            stepped.set_cell(r, c, cell)
+    for _ in range(3):
+        stepped.next_generation()
+    life.advance(3)
+    assert life.get_board() == stepped.get_board()
+    assert life.get_generation() == 8
+
+def test_stamp_places_pattern_and_clips_edges(life5):
+    """Test that stamp sets a pattern's cells and skips cells off the board."""
+    life = life5
+    life.stamp('glider', 0, 0)
+    glider = {(0, 2), (1, 0), (1, 2), (2, 1), (2, 2)}
+    alive = {(r, c) for r in range(5) for c in range(88) if life.is_cell_alive(r, c)}
+    assert alive == glider
+    
+    # A block at the bottom-right corner keeps only its on-board cell
+    life.clear()
+    life.stamp('block', 4, 87)
+    assert sum(map(sum, life.get_board())) == 1
+    assert life.is_cell_alive(4, 87)
+
+def test_set_region_and_clear(life5):
+    """Test that set_region fills a clipped rectangle and clear empties the board."""
+    life = life5
+    life.set_region(3, 7, 85, 90, 1)
+    alive = {(r, c) for r in range(5) for c in range(88) if life.is_cell_alive(r, c)}
+    assert alive == {(r, c) for r in (3, 4) for c in (85, 86, 87)}
+    
+    # The halo stays dead, so the next generation sees a dead border
+    assert life.count_live_neighbors(4, 87) == 3
+    
+    life.clear()
+    assert sum(map(sum, life.get_board())) == 0
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_random_top_row_matches_sequential_lcg(use_numpy, monkeypatch):
+    """Test that the jump-table top row matches stepping the LCG column by column."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(life_module, "NUMPY_AVAILABLE", use_numpy)
+    
+    life = Life(height=3)
+    for generation in range(20):
+        life.generation = generation
+        life.set_region(0, 1, 0, life.width, 0)
+        life.add_random_top_row()
+        
+        state = life_module._splitmix64(generation)
+        expected = []
+        for _ in range(life.width):
+            state = (1664525 * state + 1013904223) % 2**32
+            expected.append(1 if state % 5 == 0 else 0)
+        assert life.get_board()[0] == expected
+
+def test_cython_kernel_rejects_short_buffers():
+    """Test that the compiled kernel checks buffer sizes, since it skips bounds checks."""
+    life_kernel = pytest.importorskip("life_kernel")
+    board = bytearray(7 * 90)
+    with pytest.raises(ValueError):
+        life_kernel.step(board, bytearray(len(board)), 6, 88)
+    life_kernel.step(board, bytearray(len(board)), 5, 88)
@@ -1,14 +1,10 @@
 #!/bin/python3
 
-import sys
-import os
 import pytest
 import io
 
-# Add the parent directory to sys.path to be able to import the modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from piano import Piano, AudioPlayer, NullAudioEngine
+import piano as piano_module
+from piano import Piano, AudioPlayer, AudioEngine, NullAudioEngine
 from life import Life, Row
 
 def test_piano_initialization():
@@ -57,8 +53,44 @@ def test_piano_row_to_keys():
     # Check that the keys correspond to the live cells
     assert keys == [10, 20, 30]
 
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_chord_pattern_detection(use_numba, monkeypatch):
+    """Test triad and cluster detection with and without the Numba kernel."""
+    if use_numba:
+        pytest.importorskip("numba")
+        piano_module._chord_pattern_kernel.cache_clear()
+        assert piano_module._chord_pattern_kernel() is not piano_module._chord_pattern
+    else:
+        monkeypatch.setattr(piano_module, "_chord_pattern_kernel", lambda: piano_module._chord_pattern)
+    engine = AudioEngine.__new__(AudioEngine)  # Skip mixer initialization
+    
+    assert engine._is_chord_pattern([55, 48, 52])  # C major, unsorted
+    assert engine._is_chord_pattern([10, 48, 51, 54])  # Diminished on top
+    assert engine._is_chord_pattern([1, 3, 5, 7, 9])  # Dense cluster
+    assert not engine._is_chord_pattern([48, 52])
+    assert not engine._is_chord_pattern([1, 3, 5, 7, 20])
+    assert not engine._is_chord_pattern([0, 10, 20, 30])
+
+def test_sample_table_matches_direct_selection():
+    """Test that the precomputed per-key table picks the same samples as a direct scan."""
+    engine = AudioEngine.__new__(AudioEngine)  # Skip mixer initialization
+    engine.sample_cache = {key: f"sample-{key}" for key in (9, 21, 24, 36, 48, 60, 84)}
+    engine._build_sample_table()
+    
+    for key in range(-5, 95):
+        closest_key = min(engine.sample_cache, key=lambda sample_key: engine._key_distance_score(sample_key, key))
+        assert engine._closest_sample_key(key) == closest_key
+        assert engine._get_sample_for_key(key) == (engine.sample_cache[closest_key], closest_key)
+    assert engine._get_sample_for_key(50) == ("sample-48", 48)
+    
+    engine.sample_cache = {}
+    engine._build_sample_table()
+    assert engine._get_sample_for_key(40) == (None, None)
+
 class TestAudioEngine(NullAudioEngine):
     """Test audio engine that tracks method calls."""
+    __test__ = False  # A helper, not a test class for pytest to collect
+    
     def __init__(self):
         self.keys_played = []
         self.chords_played = []
@@ -77,6 +109,7 @@ def test_piano_play():
     """Test that the Piano play method correctly processes rows from Life."""
     # Create piano with TestAudioEngine
     piano = Piano(generations=2, width=5, height=3, audio_enabled=False)
+    piano.delay_ms = 0  # Don't wait between generations
     test_engine = TestAudioEngine()
     piano.audio_engine = test_engine
     
@@ -105,6 +138,63 @@ def test_piano_play():
         assert isinstance(keys, list)
         assert keys == [1, 3]
 
+def test_piano_keys_played_callback():
+    """Test that each generation's keys are reported to the callbacks around playing."""
+    reported = []
+    generations_ended = []
+    piano = Piano(generations=1, width=5, height=3, audio_enabled=False,
+                  on_keys_played=reported.append,
+                  on_generation_end=lambda: generations_ended.append(len(reported)))
+    test_engine = TestAudioEngine()
+    piano.audio_engine = test_engine
+    
+    piano.game.set_cell(2, 1, 1)
+    piano.game.set_cell(2, 3, 1)
+    piano._play_generation()
+    assert reported == [[1, 3]]
+    assert test_engine.keys_played == [[1, 3]]
+    assert generations_ended == [1]
+    
+    # Nothing is reported while muted, but the generation still ends
+    piano.game.set_cell(2, 0, 1)
+    piano.set_mute(True)
+    piano._play_generation()
+    assert reported == [[1, 3]]
+    assert generations_ended == [1, 1]
+    
+    # The keys callback can be replaced after construction
+    replaced = []
+    piano.set_keys_played_callback(replaced.append)
+    piano.set_mute(False)
+    piano.game.set_cell(2, 4, 1)
+    piano._play_generation()
+    assert replaced == [[4]]
+
+def test_piano_play_counts_playing_time_towards_delay(monkeypatch):
+    """Test that the step delay is measured from the previous deadline, not the end of playing."""
+    clock = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(piano_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(piano_module.time, "sleep", fake_sleep)
+
+    piano = Piano(generations=3, width=5, height=3, audio_enabled=False)
+    piano.delay_ms = 200
+
+    # Each generation takes 50ms to play
+    def slow_generation():
+        clock[0] += 0.05
+
+    piano._play_generation = slow_generation
+    piano._play_limited(3)
+
+    assert sleeps == pytest.approx([0.15, 0.15])
+    assert clock[0] == pytest.approx(0.45)
+
 def test_piano_play_keys():
     """Test that the Piano play_keys method correctly passes keys to the audio engine."""
     # Create piano with TestAudioEngine
@@ -1,16 +1,38 @@
 #!/usr/bin/env python3
 """
 Simple script to update pip to the latest version.
-Run with: python update_pip.py
+Run with: python update_pip.py [--force]
+
+Nothing is downloaded when the installed pip is already at least TARGET_VERSION,
+unless --force is given.
 """
 
 import sys
 import subprocess
-import os
+from importlib.metadata import version, PackageNotFoundError
+
+# pip releases at or above this version are considered up to date
+TARGET_VERSION = (25, 0)
+
+def installed_pip_version():
+    """Return the installed pip's (major, minor) version, or None if it is missing or unreadable."""
+    try:
+        major, minor = version("pip").split(".")[:2]
+        return int(major), int(minor)
+    except (PackageNotFoundError, ValueError):
+        return None
+
+def update_pip(force=False):
+    current = installed_pip_version()
+    if not force and current is not None and current >= TARGET_VERSION:
+        print(f"pip {current[0]}.{current[1]} is up to date, skipping the update")
+        return 0
 
-def update_pip():
     print("Updating pip to the latest version...")
     try:
+        if current is None:
+            # Bootstrap pip from the wheel bundled with Python before upgrading it
+            subprocess.check_call([sys.executable, "-m", "ensurepip", "--upgrade"])
         subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
         print("Pip has been updated successfully!")
     except subprocess.CalledProcessError as e:
@@ -19,4 +41,4 @@ def update_pip():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(update_pip())
+    sys.exit(update_pip(force="--force" in sys.argv[1:]))
@@ -6,7 +6,6 @@ This script adds the config and python directories to the Python path
 and then launches the main application.
 """
 
-import os
 import sys
 from pathlib import Path
 
@@ -20,9 +19,6 @@ CONFIG_PATH = PROJECT_ROOT / "config"
 sys.path.insert(0, str(PYTHON_PATH))
 sys.path.insert(0, str(CONFIG_PATH))
 
-# Change to the python directory
-os.chdir(str(PYTHON_PATH))
-
 # Import and run the main function
 try:
     from main import main